@@ -0,0 +1,138 @@
+"""
+대화 메모리 메시지 코덱 비교
+- 턴(사용자 질문 + 답변)당 인코딩/디코딩 시간, 메시지당 바이트 수
+- Redis에 세션 하나(REDIS_MAX_MESSAGES개 메시지)를 저장했을 때의 MEMORY USAGE
+
+실행: PYTHONPATH=src python scripts/benchmark_codec.py --iterations 2000
+      (Redis 없이 측정하려면 --skip-redis)
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import uuid
+from time import perf_counter
+
+from loguru import logger as loguru_logger
+
+from core.config import settings
+from core.logging import setup_logger
+from domain.chat import Message
+from infrastructure.redis.client import RedisClient
+from repositories.memory import RedisChatMemoryRepository
+from utils.codec import JsonMessageCodec, MessageCodec, MsgpackMessageCodec
+
+logger = setup_logger(__name__)
+
+TURN = [
+    Message(
+        content="스마트스토어 정산은 언제 되나요? 부분 환불이 있으면 어떻게 되나요?",
+        role="user",
+    ),
+    Message(
+        content=(
+            "정산은 구매확정일 기준 1영업일 후에 정산 대금이 지급됩니다. "
+            "빠른정산 대상 판매자는 발송처리 다음 영업일에 정산받을 수 있습니다.\n\n"
+            "부분 환불이 발생한 경우 환불 금액을 제외한 나머지 금액만 정산되며, "
+            "정산 내역은 판매자센터 > 정산관리 > 정산 내역에서 확인하실 수 있습니다.\n"
+        )
+        * 6,
+        role="assistant",
+    ),
+]
+
+
+class LegacyJsonMessageCodec(MessageCodec):
+    # 코덱 도입 전 포맷 (ensure_ascii=True)
+    name = "json(ascii)"
+
+    def encode(self, message: Message) -> bytes:
+        return json.dumps({"content": message.content, "role": message.role}).encode()
+
+
+def build_codecs() -> list[MessageCodec]:
+    codecs: list[MessageCodec] = [LegacyJsonMessageCodec(), JsonMessageCodec()]
+    try:
+        codecs.append(MsgpackMessageCodec(compress_min_bytes=0))
+        msgpack_zstd = MsgpackMessageCodec(
+            compress_min_bytes=settings.CHAT_MEMORY_COMPRESS_MIN_BYTES
+        )
+        if msgpack_zstd.compression_enabled:
+            msgpack_zstd.name = "msgpack+zstd"
+            codecs.append(msgpack_zstd)
+        else:
+            logger.warning("zstandard is not installed, skipping msgpack+zstd")
+    except ImportError:
+        logger.warning("msgpack is not installed, skipping msgpack codecs")
+    return codecs
+
+
+def benchmark_cpu(codec: MessageCodec, iterations: int) -> None:
+    encoded = [codec.encode(message) for message in TURN]
+    assert [codec.decode(data) for data in encoded] == TURN
+
+    start_time = perf_counter()
+    for _ in range(iterations):
+        for message in TURN:
+            codec.encode(message)
+    encode_us = (perf_counter() - start_time) / iterations * 1_000_000
+
+    start_time = perf_counter()
+    for _ in range(iterations):
+        for data in encoded:
+            codec.decode(data)
+    decode_us = (perf_counter() - start_time) / iterations * 1_000_000
+
+    print(
+        f"{codec.name:<14} "
+        f"bytes/turn={sum(len(data) for data in encoded):>6} "
+        f"(user={len(encoded[0])}, assistant={len(encoded[1])}) "
+        f"encode={encode_us:7.2f}us/turn decode={decode_us:7.2f}us/turn"
+    )
+
+
+async def benchmark_redis(codec: MessageCodec) -> None:
+    repository = RedisChatMemoryRepository(codec=codec)
+    session_id = f"benchmark-codec-{uuid.uuid4().hex}"
+    key = repository._get_key(session_id)
+
+    for _ in range(repository.max_messages // len(TURN)):
+        await repository.append_turn(session_id, TURN)
+
+    async with RedisClient.get_binary_connection() as redis:
+        memory_usage = await redis.memory_usage(key, samples=0)
+        await redis.delete(key)
+
+    print(
+        f"{codec.name:<14} messages={repository.max_messages} "
+        f"redis_memory={memory_usage:>7} bytes/session"
+    )
+
+
+async def main(iterations: int, skip_redis: bool) -> None:
+    loguru_logger.disable("core.decorators")
+    codecs = build_codecs()
+
+    print("== serialize/deserialize ==")
+    for codec in codecs:
+        benchmark_cpu(codec, iterations)
+
+    if not skip_redis:
+        print("== redis memory ==")
+        for codec in codecs:
+            await benchmark_redis(codec)
+        await RedisClient.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--iterations", type=int, default=2000)
+    parser.add_argument("--skip-redis", action="store_true")
+    args = parser.parse_args()
+
+    try:
+        asyncio.run(main(args.iterations, args.skip_redis))
+    except Exception as e:
+        logger.error(f"Error during codec benchmark: {str(e)}")
+        sys.exit(1)
@@ -0,0 +1,97 @@
+"""
+대화 한 턴당 Redis 메모리 호출 비교
+- three_calls: get_recent_messages + save_message(user) + save_message(assistant) (왕복 3회)
+- append_turn: get_recent_messages + append_turn(user, assistant) (왕복 2회)
+
+실행: PYTHONPATH=src python scripts/benchmark_memory.py --sessions 50 --turns 20
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import uuid
+from time import perf_counter
+from typing import Awaitable, Callable
+
+from loguru import logger as loguru_logger
+
+from core.logging import setup_logger
+from domain.chat import Message
+from infrastructure.redis.client import RedisClient
+from repositories.memory import RedisChatMemoryRepository
+
+logger = setup_logger(__name__)
+
+USER_MESSAGE = Message(content="스마트스토어 정산은 언제 되나요?", role="user")
+ASSISTANT_MESSAGE = Message(
+    content="정산은 구매확정 후 1영업일에 진행됩니다. " * 20, role="assistant"
+)
+
+
+async def three_calls_turn(repository: RedisChatMemoryRepository, session_id: str):
+    await repository.get_recent_messages(session_id)
+    await repository.save_message(session_id, USER_MESSAGE)
+    await repository.save_message(session_id, ASSISTANT_MESSAGE)
+
+
+async def append_turn_turn(repository: RedisChatMemoryRepository, session_id: str):
+    await repository.get_recent_messages(session_id)
+    await repository.append_turn(session_id, [USER_MESSAGE, ASSISTANT_MESSAGE])
+
+
+async def run_benchmark(
+    name: str,
+    turn: Callable[[RedisChatMemoryRepository, str], Awaitable[None]],
+    sessions: int,
+    turns: int,
+) -> None:
+    repository = RedisChatMemoryRepository()
+    session_ids = [f"benchmark-{name}-{uuid.uuid4().hex}" for _ in range(sessions)]
+    latencies: list[float] = []
+
+    async def run_session(session_id: str) -> None:
+        for _ in range(turns):
+            start_time = perf_counter()
+            await turn(repository, session_id)
+            latencies.append((perf_counter() - start_time) * 1000)
+
+    start_time = perf_counter()
+    await asyncio.gather(*[run_session(session_id) for session_id in session_ids])
+    elapsed = perf_counter() - start_time
+
+    async with RedisClient.get_connection() as redis:
+        await redis.delete(
+            *[repository._get_key(session_id) for session_id in session_ids]
+        )
+
+    latencies.sort()
+    print(
+        f"{name:<12} turns={len(latencies):>6} "
+        f"mean={statistics.fmean(latencies):7.3f}ms "
+        f"p50={latencies[len(latencies) // 2]:7.3f}ms "
+        f"p95={latencies[int(len(latencies) * 0.95)]:7.3f}ms "
+        f"throughput={len(latencies) / elapsed:9.1f} turns/s"
+    )
+
+
+async def main(sessions: int, turns: int) -> None:
+    # 메서드별 실행 시간 로그가 측정에 섞이지 않도록 비활성화
+    loguru_logger.disable("core.decorators")
+
+    await run_benchmark("three_calls", three_calls_turn, sessions, turns)
+    await run_benchmark("append_turn", append_turn_turn, sessions, turns)
+    await RedisClient.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sessions", type=int, default=50)
+    parser.add_argument("--turns", type=int, default=20)
+    args = parser.parse_args()
+
+    try:
+        asyncio.run(main(args.sessions, args.turns))
+    except Exception as e:
+        logger.error(f"Error during memory benchmark: {str(e)}")
+        sys.exit(1)
@@ -1,31 +1,62 @@
+import multiprocessing
+import os
 import pickle
 import re
 import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import batched
+from typing import Iterable, Iterator
 
 import tiktoken
 
+from core.config import settings
+from core.decorators import log_execution_time
 from core.logging import setup_logger
 from domain.knowledge import NaverFAQ
 from repositories.knowledge import ChromaKnowledgeRepository
+from repositories.vector_index import InMemoryKnowledgeRepository
+from utils.text import split_passages
 
 logger = setup_logger(__name__)
 
 
+MAX_FAQ_TOKENS = 8192
+
+_INITIAL_TAGS_PATTERN = re.compile(r"^(?:\[([^\]]+)\])+\s*(.*)$")
+_TAG_PATTERN = re.compile(r"\[([^\]]+)\]")
+_REPLACE_PATTERNS = [
+    ("\xa0", " "),
+    ("\u200b", ""),
+    ("\ufeff", ""),
+]
+_REMOVE_PATTERNS = [
+    re.compile(pattern, flags=re.DOTALL)
+    for pattern in [
+        r"\n\n위 도움말이 도움이 되었나요\?.*",
+        r"별점\d점",
+        r"소중한 의견을.*",
+        r"보내기\n*",
+        r"도움말 닫기.*",
+        r"관련 도움말/키워드.*?(?=\n\n|$)",
+    ]
+]
+_NEWLINES_PATTERN = re.compile(r"\n{3,}")
+
+
 def extract_tags_and_question(text: str) -> tuple[list[str], str]:
     """
     질문 텍스트의 시작 부분에서만 태그를 추출하고 실제 질문을 분리
     예: "[태그1][태그2] 질문" -> (["태그1", "태그2"], "질문")
     """
-    initial_tags_pattern = r"^(?:\[([^\]]+)\])+\s*(.*)$"
-    match = re.match(initial_tags_pattern, text)
+    match = _INITIAL_TAGS_PATTERN.match(text)
 
     if match:
         full_match = match.group(0)
         remaining_text = match.group(2)
 
-        tags = re.findall(
-            r"\[([^\]]+)\]", text[: len(full_match) - len(remaining_text)]
-        )
+        tags = _TAG_PATTERN.findall(text[: len(full_match) - len(remaining_text)])
         return tags, remaining_text.strip()
 
     return [], text.strip()
@@ -35,46 +66,29 @@ def clean(text: str) -> str:
     """
     FAQ 답변 텍스트에서 불필요한 부분을 제거하고 줄바꿈을 정리
     """
-    replace_patterns = [
-        ("\xa0", " "),
-        ("\u200b", ""),
-        ("\ufeff", ""),
-    ]
-
-    for pattern, replacement in replace_patterns:
+    for pattern, replacement in _REPLACE_PATTERNS:
         text = text.replace(pattern, replacement)
 
-    patterns_to_remove = [
-        r"\n\n위 도움말이 도움이 되었나요\?.*",
-        r"별점\d점",
-        r"소중한 의견을.*",
-        r"보내기\n*",
-        r"도움말 닫기.*",
-        r"관련 도움말/키워드.*?(?=\n\n|$)",
-    ]
-
     cleaned_text = text
-    for pattern in patterns_to_remove:
-        cleaned_text = re.sub(pattern, "", cleaned_text, flags=re.DOTALL)
+    for pattern in _REMOVE_PATTERNS:
+        cleaned_text = pattern.sub("", cleaned_text)
 
-    return re.sub(r"\n{3,}", "\n\n", cleaned_text).strip()
+    return _NEWLINES_PATTERN.sub("\n\n", cleaned_text).strip()
 
 
-async def process_and_load_to_chroma(
-    input_path: str = "data/faq.pkl", processed_path: str = "data/faq_processed.pkl"
-):
-    """
-    FAQ 데이터를 전처리하고 ChromaDB에 로드
-    """
-    logger.info("Starting FAQ data processing and loading")
+@lru_cache()
+def get_encoding():
+    return tiktoken.encoding_for_model("text-embedding-3-small")
 
-    encoding = tiktoken.encoding_for_model("text-embedding-3-small")
 
-    with open(input_path, "rb") as f:
-        faq_dict = pickle.load(f)
+def preprocess_chunk(items: list[tuple[str, str]]) -> list[NaverFAQ]:
+    """
+    (질문, 답변) 묶음을 정제하고 토큰 수 제한을 넘는 FAQ를 제외 (프로세스 풀에서 실행)
+    """
+    encoding = get_encoding()
 
-    processed_data = {}
-    for question, answer in faq_dict.items():
+    faqs = []
+    for question, answer in items:
         tags, q = extract_tags_and_question(question)
 
         clean_question = clean(q)
@@ -82,34 +96,104 @@ async def process_and_load_to_chroma(
 
         tokens = encoding.encode(clean_question + "\n" + clean_answer_text)
 
-        if len(tokens) > 8192:
+        if len(tokens) > MAX_FAQ_TOKENS:
             continue
 
-        processed_data[clean_question] = {
-            "tags": tags,
-            "question": clean_question,
-            "answer": clean_answer_text,
-        }
+        # 긴 답변은 구조 기준으로 겹치는 passage로 분할 (FULL/ANSWER 뷰의 임베딩 단위)
+        passages = split_passages(
+            clean_answer_text,
+            max_tokens=settings.PASSAGE_MAX_TOKENS,
+            overlap_tokens=settings.PASSAGE_OVERLAP_TOKENS,
+            count_tokens=lambda text: len(encoding.encode(text)),
+        )
+
+        faqs.append(
+            NaverFAQ(
+                question=clean_question,
+                answer=clean_answer_text,
+                tags=tags,
+                passages=passages,
+            )
+        )
+
+    return faqs
+
 
+def iter_processed_chunks(
+    items: Iterable[tuple[str, str]], chunk_size: int, max_workers: int
+) -> Iterator[list[NaverFAQ]]:
+    """
+    입력을 chunk 단위로 프로세스 풀에 넘기고 결과를 입력 순서대로 반환
+    동시에 처리 중인 chunk 수를 제한하여 메모리 사용량을 일정하게 유지
+    부모 프로세스에는 이미 Chroma 클라이언트와 ChromaExecutor 스레드가 있으므로
+    fork 대신 spawn으로 워커를 생성 (fork 시 잠긴 락/스레드 상태가 복제될 수 있음)
+    """
+    max_pending = max_workers * 2
+
+    with ProcessPoolExecutor(
+        max_workers=max_workers, mp_context=multiprocessing.get_context("spawn")
+    ) as pool:
+        pending = deque()
+        for chunk in batched(items, chunk_size):
+            pending.append(pool.submit(preprocess_chunk, list(chunk)))
+            if len(pending) >= max_pending:
+                yield pending.popleft().result()
+
+        while pending:
+            yield pending.popleft().result()
+
+
+def iter_processed_faqs(
+    input_path: str, processed_path: str, chunk_size: int, max_workers: int
+) -> Iterator[NaverFAQ]:
+    """
+    전처리된 FAQ를 스트리밍으로 반환하면서 chunk 단위로 processed_path에 기록
+    processed_path는 chunk마다 pickle된 NaverFAQ 리스트가 연속으로 저장된 형식
+    """
+    with open(input_path, "rb") as f:
+        faq_dict = pickle.load(f)
+
+    processed_count = 0
     with open(processed_path, "wb") as f:
-        pickle.dump(processed_data, f)
+        for faqs in iter_processed_chunks(faq_dict.items(), chunk_size, max_workers):
+            pickle.dump(faqs, f)
+            processed_count += len(faqs)
+            yield from faqs
 
-    logger.info(f"Processed {len(processed_data)} FAQs")
+    logger.info(f"Processed {processed_count} of {len(faq_dict)} FAQs")
 
-    faqs = [
-        NaverFAQ(
-            question=question,
-            answer=metadata["answer"],
-            tags=metadata.get("tags", []),
-        )
-        for question, metadata in processed_data.items()
-    ]
 
+@log_execution_time
+async def process_and_load_to_chroma(
+    input_path: str = "data/faq.pkl",
+    processed_path: str = "data/faq_processed.pkl",
+    chunk_size: int = 500,
+    max_workers: int | None = None,
+):
+    """
+    FAQ 데이터를 전처리하고 ChromaDB에 로드
+    전처리 결과는 chunk 단위로 바로 임베딩/upsert 단계로 전달됨
+    """
+    logger.info("Starting FAQ data processing and loading")
+
+    faqs = iter_processed_faqs(
+        input_path, processed_path, chunk_size, max_workers or os.cpu_count() or 1
+    )
+
+    # 변경된 FAQ만 임베딩하도록 content hash 기반으로 동기화
     knowledge_repo = ChromaKnowledgeRepository()
-    await knowledge_repo.bulk_add_faqs(faqs)
+    report = await knowledge_repo.sync_faqs(faqs)
 
     logger.info("FAQ data successfully loaded into ChromaDB")
-    return len(processed_data)
+
+    count = report.added + report.updated + report.unchanged
+
+    # 워커들이 mmap으로 공유할 임베딩 스냅샷, BM25 색인, 카테고리 centroid 생성
+    if count:
+        InMemoryKnowledgeRepository().save_snapshot()
+        knowledge_repo.save_lexical_index(await knowledge_repo.get_all_faqs())
+        await knowledge_repo.save_tag_router()
+    return count
 
 
 if __name__ == "__main__":
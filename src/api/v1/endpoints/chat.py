@@ -5,9 +5,10 @@ from fastapi import APIRouter, Depends, HTTPException
 from starlette.responses import StreamingResponse
 
 from api.v1.deps import get_chat_service, get_session_id
+from core.config import settings
 from schemes.response import ChatRequest, ErrorResponse, WelcomeResponse
 from services.chat import SmartStoreChatService
-from utils.streaming import StreamingJsonResponse
+from utils.streaming import SSEEncoder
 
 router = APIRouter()
 
@@ -33,8 +34,13 @@ async def chat(
             session_id=session_id, message=request.message
         )
 
+        encoder = SSEEncoder(
+            coalesce_ms=settings.SSE_COALESCE_MS,
+            coalesce_bytes=settings.SSE_COALESCE_BYTES,
+            heartbeat_interval=settings.SSE_HEARTBEAT_INTERVAL,
+        )
         return StreamingResponse(
-            StreamingJsonResponse.create_stream(response_generator),
+            encoder.encode(response_generator),
             media_type="text/event-stream",
         )
     except Exception as e:
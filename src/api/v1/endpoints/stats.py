@@ -0,0 +1,19 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Depends
+
+from api.v1.deps import get_container
+from container import ServiceContainer
+
+router = APIRouter()
+
+
+@router.get("/")
+async def stats(
+    container: Annotated[ServiceContainer, Depends(get_container)],
+) -> dict:
+    """
+    OpenAI 엔드포인트별, Chroma 실행기의 동시 실행 수 및 대기열 지표와
+    임베딩 캐시의 hit/miss/eviction 지표, 질문 검증 단계별(accept/reject/llm) 처리 수를 반환합니다.
+    """
+    return container.collect_stats()
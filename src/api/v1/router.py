@@ -1,6 +1,7 @@
 from fastapi import APIRouter
 
-from api.v1.endpoints import chat
+from api.v1.endpoints import chat, stats
 
 api_v1_router = APIRouter()
 api_v1_router.include_router(chat.router, prefix="/chat", tags=["chat"])
+api_v1_router.include_router(stats.router, prefix="/stats", tags=["stats"])
@@ -0,0 +1,187 @@
+import asyncio
+import importlib.util
+from dataclasses import dataclass, field
+
+from core.config import settings
+from core.logging import setup_logger
+from infrastructure.chroma.executor import ChromaExecutor
+from infrastructure.openai.client import get_upstream_limiter
+from infrastructure.redis.client import RedisClient
+from interfaces.repositories.knowledge import KnowledgeBaseRepository
+from interfaces.repositories.memory import ChatMemoryRepository
+from interfaces.services.llm import LLMService
+from interfaces.services.reranker import RerankerService
+from interfaces.services.summary import ChatSummaryService
+from interfaces.services.validator import QuestionValidatorService
+from repositories.answer_cache import SemanticAnswerCacheRepository
+from repositories.embedding import TieredEmbeddingCacheRepository
+from repositories.knowledge import ChromaKnowledgeRepository
+from repositories.memory import RedisChatMemoryRepository
+from repositories.memory_cache import CachedChatMemoryRepository
+from repositories.vector_index import InMemoryKnowledgeRepository
+from services.chat import SmartStoreChatService
+from services.llm import OpenAIService
+from services.reranker import CrossEncoderRerankerService
+from services.summary import RollingChatSummaryService
+from services.validator import SmartStoreQuestionValidator
+
+logger = setup_logger(__name__)
+
+
+@dataclass
+class ServiceContainer:
+    """
+    애플리케이션 수명 동안 공유되는 서비스/레포지토리 인스턴스 모음
+    lifespan 시작 시 한 번 생성되어 app.state에 보관됨
+    """
+
+    llm_service: LLMService
+    validator_service: QuestionValidatorService
+    memory_repository: ChatMemoryRepository
+    knowledge_repository: KnowledgeBaseRepository
+    chat_service: SmartStoreChatService
+    reranker: RerankerService | None = None
+    summary_service: ChatSummaryService | None = None
+    _stats_task: asyncio.Task | None = field(default=None, init=False, repr=False)
+
+    @classmethod
+    def build(cls) -> "ServiceContainer":
+        llm_service = OpenAIService()
+        validator_service = SmartStoreQuestionValidator(llm_service=llm_service)
+        memory_repository = RedisChatMemoryRepository()
+        if settings.CHAT_HISTORY_CACHE_ENABLED:
+            memory_repository = CachedChatMemoryRepository(memory_repository)
+        knowledge_repository_class = (
+            InMemoryKnowledgeRepository
+            if settings.KNOWLEDGE_BACKEND == "memory"
+            else ChromaKnowledgeRepository
+        )
+        knowledge_repository = knowledge_repository_class(
+            embedding_cache=(
+                TieredEmbeddingCacheRepository()
+                if settings.EMBEDDING_CACHE_ENABLED
+                else None
+            )
+        )
+        reranker = cls._build_reranker()
+        summary_service = (
+            RollingChatSummaryService(
+                llm_service=llm_service, memory_repository=memory_repository
+            )
+            if settings.CHAT_SUMMARY_ENABLED
+            else None
+        )
+        chat_service = SmartStoreChatService(
+            llm_service=llm_service,
+            validator_service=validator_service,
+            memory_repository=memory_repository,
+            knowledge_repository=knowledge_repository,
+            answer_cache=(
+                SemanticAnswerCacheRepository()
+                if settings.ANSWER_CACHE_ENABLED
+                else None
+            ),
+            reranker=reranker,
+            summary_service=summary_service,
+        )
+        return cls(
+            llm_service=llm_service,
+            validator_service=validator_service,
+            memory_repository=memory_repository,
+            knowledge_repository=knowledge_repository,
+            chat_service=chat_service,
+            reranker=reranker,
+            summary_service=summary_service,
+        )
+
+    @staticmethod
+    def _build_reranker() -> RerankerService | None:
+        if not settings.RERANK_ENABLED:
+            return None
+
+        if importlib.util.find_spec("sentence_transformers") is None:
+            logger.warning(
+                "RERANK_ENABLED is set but sentence-transformers is not installed, "
+                "reranking disabled"
+            )
+            return None
+
+        return CrossEncoderRerankerService()
+
+    async def warm_up(self) -> None:
+        # 첫 요청이 연결 수립 및 임베딩 모델 로딩 비용을 지불하지 않도록 미리 호출
+        try:
+            async with RedisClient.get_connection() as redis:
+                await redis.ping()
+        except Exception as e:
+            logger.warning(f"Redis warm-up failed: {str(e)}")
+
+        if isinstance(self.memory_repository, CachedChatMemoryRepository):
+            await self.memory_repository.start()
+
+        try:
+            await self.knowledge_repository.embed_query("스마트스토어")
+        except Exception as e:
+            logger.warning(f"Embedding warm-up failed: {str(e)}")
+
+        if self.reranker is not None:
+            try:
+                await self.reranker.rerank(
+                    "스마트스토어",
+                    [{"question": "스마트스토어", "answer": ""}],
+                    limit=1,
+                )
+            except Exception as e:
+                logger.warning(f"Reranker warm-up failed: {str(e)}")
+
+        if settings.STATS_LOG_INTERVAL > 0:
+            self._stats_task = asyncio.create_task(self._log_stats_periodically())
+
+    def collect_stats(self) -> dict:
+        stats = {
+            "openai": {
+                endpoint: get_upstream_limiter(endpoint).stats.to_dict()
+                for endpoint in ("chat", "embeddings")
+            },
+            "chroma_executor": ChromaExecutor.get_instance().stats.to_dict(),
+        }
+
+        if isinstance(self.validator_service, SmartStoreQuestionValidator):
+            stats["validator_tiers"] = dict(self.validator_service.tier_counts)
+
+        embedding_cache = (
+            self.knowledge_repository.embedding_cache
+            if isinstance(self.knowledge_repository, ChromaKnowledgeRepository)
+            else None
+        )
+        if isinstance(embedding_cache, TieredEmbeddingCacheRepository):
+            stats["embedding_cache"] = {
+                "local": embedding_cache.stats.to_dict(),
+                "redis": embedding_cache.redis_stats.to_dict(),
+            }
+        return stats
+
+    async def _log_stats_periodically(self) -> None:
+        while True:
+            await asyncio.sleep(settings.STATS_LOG_INTERVAL)
+            stats = self.collect_stats()
+            for endpoint, endpoint_stats in stats["openai"].items():
+                logger.info(f"OpenAI {endpoint} stats: {endpoint_stats}")
+            logger.info(f"Chroma executor stats: {stats['chroma_executor']}")
+            if "validator_tiers" in stats:
+                logger.info(f"Validator tier counts: {stats['validator_tiers']}")
+            if "embedding_cache" in stats:
+                logger.info(f"Embedding cache stats: {stats['embedding_cache']}")
+
+    async def close(self) -> None:
+        if self._stats_task is not None:
+            self._stats_task.cancel()
+            await asyncio.gather(self._stats_task, return_exceptions=True)
+        if self.summary_service is not None:
+            await self.summary_service.close()
+        if isinstance(self.memory_repository, CachedChatMemoryRepository):
+            await self.memory_repository.close()
+        ChromaExecutor.get_instance().shutdown()
+        if isinstance(self.reranker, CrossEncoderRerankerService):
+            self.reranker.shutdown()
+        await RedisClient.close()
@@ -28,15 +28,127 @@ class BaseAppSettings(BaseSettings):
     OPENAI_EMBEDDING_MODEL: str = "text-embedding-3-small"
     OPENAI_CHAT_MODEL: str = "gpt-4o-mini"
 
+    OPENAI_MAX_CONNECTIONS: int = 100
+    OPENAI_MAX_KEEPALIVE_CONNECTIONS: int = 20
+    OPENAI_KEEPALIVE_EXPIRY: float = 30.0
+    OPENAI_TIMEOUT: float = 30.0
+    OPENAI_CONNECT_TIMEOUT: float = 5.0
+    OPENAI_CHAT_CONCURRENCY: int = 32
+    OPENAI_EMBEDDING_CONCURRENCY: int = 16
+    OPENAI_MAX_RETRIES: int = 3
+    OPENAI_RETRY_BASE_DELAY: float = 0.5
+    OPENAI_RETRY_MAX_DELAY: float = 8.0
+
     REDIS_HOST: str = "localhost"
     REDIS_PORT: int = 6379
     REDIS_DB: int = 0
     REDIS_PASSWORD: str = ""
 
     REDIS_MESSAGE_TTL: int = 10 * 60  # 10분
+    REDIS_MAX_MESSAGES: int = 20
+    # 대화 메시지 저장 포맷 (msgpack: msgpack 설치 필요, msgpack+zstd: zstandard도 필요)
+    # msgpack+zstd는 CHAT_MEMORY_COMPRESS_MIN_BYTES 이상인 메시지만 압축
+    CHAT_MEMORY_CODEC: Literal["json", "msgpack", "msgpack+zstd"] = "json"
+    CHAT_MEMORY_COMPRESS_MIN_BYTES: int = 1024
+    # 워커별 최근 대화 캐시 (Redis pub/sub으로 다른 워커의 쓰기를 무효화)
+    CHAT_HISTORY_CACHE_ENABLED: bool = False
+    CHAT_HISTORY_CACHE_MAX_SIZE: int = 10_000
+    CHAT_HISTORY_CACHE_TTL: int = 60
+
+    # FAQ 적재 시 임베딩 요청 배치 크기 및 동시 요청 수
+    EMBEDDING_BATCH_MAX_TOKENS: int = 200_000
+    EMBEDDING_BATCH_MAX_INPUTS: int = 2048
+    EMBEDDING_INGEST_CONCURRENCY: int = 4
+    FAQ_SYNC_CHUNK_SIZE: int = 1000
+
+    EMBEDDING_CACHE_ENABLED: bool = True
+    EMBEDDING_CACHE_MAX_SIZE: int = 10_000
+    EMBEDDING_CACHE_TTL: int = 60 * 60  # 1시간
+    EMBEDDING_CACHE_REDIS_ENABLED: bool = False
+    EMBEDDING_CACHE_REDIS_TTL: int = 24 * 60 * 60  # 1일
+
+    ANSWER_CACHE_ENABLED: bool = True
+    ANSWER_CACHE_SIMILARITY_THRESHOLD: float = 0.95
+    ANSWER_CACHE_MAX_SIZE: int = 1_000
+    ANSWER_CACHE_TTL: int = 6 * 60 * 60  # 6시간
+    # 다른 프로세스(prestart)의 FAQ 동기화를 감지하기 위해 코퍼스 버전을 다시 읽는 주기
+    CORPUS_VERSION_REFRESH_INTERVAL: int = 30
+
+    # structured: 단일 JSON 응답 호출 / ensemble: 직접·간접 검증 2회 호출
+    VALIDATION_MODE: Literal["structured", "ensemble"] = "structured"
+
+    # 검색 가중 점수(벡터 최대 2.4 + BM25 최대 LEXICAL_WEIGHT) 기준 LLM 검증 생략 구간
+    # 임계값은 보정되지 않은 초기값이므로, 활성화 전 /stats의 validator tier 분포와
+    # LLM 검증 결과를 비교해 오판이 없는 구간으로 조정할 것
+    VALIDATION_FAST_PATH_ENABLED: bool = False
+    VALIDATION_FAST_ACCEPT_SCORE: float = 1.0
+    VALIDATION_FAST_REJECT_SCORE: float = 0.2
+
+    # 검증과 답변 생성을 동시에 시작 (부정 판정 시 답변 스트림 취소)
+    CHAT_SPECULATIVE_ANSWER: bool = False
+    # 후속 질문 생성 시작 시점: 답변 완료 후 / FAQ 기반 즉시 / 부분 답변 기반
+    CHAT_FOLLOW_UP_MODE: Literal[
+        "after_answer", "from_context", "from_partial_answer"
+    ] = "after_answer"
+    CHAT_FOLLOW_UP_PARTIAL_ANSWER_CHARS: int = 200
+
+    # SSE 응답: 답변 토큰을 시간/크기 단위로 모아서 전송, 유휴 시 heartbeat 전송 (0이면 비활성)
+    SSE_COALESCE_MS: float = 20
+    SSE_COALESCE_BYTES: int = 64
+    SSE_HEARTBEAT_INTERVAL: float = 15
+
+    # 저장된 대화가 토큰 임계값을 넘으면 오래된 메시지를 백그라운드에서 요약으로 압축
+    CHAT_SUMMARY_ENABLED: bool = True
+    CHAT_SUMMARY_TRIGGER_TOKENS: int = 1500
+    CHAT_SUMMARY_KEEP_MESSAGES: int = 4
+
+    # 프롬프트별 토큰 예산 (FAQ 컨텍스트 / 대화 내역), FAQ 답변 하나는 최대 CONTEXT_MAX_ANSWER_TOKENS
+    CONTEXT_MAX_ANSWER_TOKENS: int = 800
+    ANSWER_CONTEXT_TOKENS: int = 2500
+    ANSWER_HISTORY_TOKENS: int = 800
+    VALIDATION_CONTEXT_TOKENS: int = 500
+    VALIDATION_HISTORY_TOKENS: int = 200
+    FOLLOW_UP_CONTEXT_TOKENS: int = 1000
+    FOLLOW_UP_HISTORY_TOKENS: int = 400
+
+    # chroma: ChromaDB 컬렉션 검색 / memory: 프로세스 내 NumPy 행렬 검색
+    KNOWLEDGE_BACKEND: Literal["chroma", "memory"] = "chroma"
+    FAQ_SNAPSHOT_DIRECTORY: str = str(ROOT_DIR / "data" / "faq_snapshot")
+
+    # 벡터 검색 결과에 BM25 점수를 가중 합산 (메뉴명/코드 등 정확한 표현 검색 보강)
+    HYBRID_SEARCH_ENABLED: bool = True
+    LEXICAL_WEIGHT: float = 0.5
+    LEXICAL_INDEX_PATH: str = str(ROOT_DIR / "data" / "bm25_index.pkl")
+
+    # 답변을 구조(문단/줄/문장) 기준으로 겹치는 passage로 나누어 FULL/ANSWER 뷰에 저장
+    PASSAGE_MAX_TOKENS: int = 256
+    PASSAGE_OVERLAP_TOKENS: int = 48
+    # 한 FAQ의 여러 passage가 상위를 차지할 수 있으므로 passage 뷰는 limit의 배수만큼 검색
+    PASSAGE_SEARCH_MULTIPLIER: int = 3
+
+    # 검색 후보를 로컬 cross-encoder로 재정렬 (sentence-transformers 설치 필요)
+    RERANK_ENABLED: bool = False
+    RERANK_MODEL: str = "cross-encoder/mmarco-mMiniLMv2-L12-H384-v1"
+    RERANK_CANDIDATES: int = 20
+    RERANK_MAX_LENGTH: int = 512
+    RERANK_CACHE_MAX_SIZE: int = 10_000
+    RERANK_CACHE_TTL: int = 3600
+
+    # 질의와 최근 대화로 FAQ 카테고리(첫 태그)를 예측하여 해당 파티션만 검색
+    TAG_ROUTING_ENABLED: bool = False
+    TAG_ROUTER_PATH: str = str(ROOT_DIR / "data" / "tag_centroids.npz")
+    TAG_ROUTING_MAX_TAGS: int = 2
+    TAG_ROUTING_MIN_SIMILARITY: float = 0.3
+    TAG_ROUTING_MARGIN: float = 0.05
+    TAG_ROUTING_HISTORY_MESSAGES: int = 2
+    TAG_ROUTING_HISTORY_WEIGHT: float = 0.5
 
     CHROMA_PERSIST_DIRECTORY: str = str(ROOT_DIR / "chroma_persist")
     CHROMA_COLLECTION_NAME: str = "smartstore_faqs"
+    CHROMA_EXECUTOR_MAX_WORKERS: int = 8
+
+    # OpenAI 엔드포인트/Chroma 실행기의 동시 실행 및 대기열 지표를 로그로 남기는 주기 (0이면 비활성)
+    STATS_LOG_INTERVAL: int = 60
 
     @computed_field
     def REDIS_URL(cls) -> str:
@@ -10,6 +10,7 @@ class CollectionType(Enum):
 class ValidationStrategy(Enum):
     DIRECT = ("direct", 1.0)
     INDIRECT = ("indirect", 0.8)
+    RETRIEVAL = ("retrieval", 1.0)
 
     def __init__(self, value: str, weight: float):
         self._value_ = value
@@ -96,6 +96,52 @@ class PromptTemplates:
         ]
     )
 
+    PT_STRUCTURED_VALIDATION = PromptTemplate(
+        [
+            Message(
+                role="system",
+                content="네이버 스마트스토어 주제와의 직접적인 관련성과 간접적인 관련성을 함께 판단해주세요.\n\n"
+                "주제:\n"
+                "- 회원 가입\n"
+                "- 상품 관리\n"
+                "- 쇼핑윈도 관리\n"
+                "- 판매 관리\n"
+                "- 정산 관리\n"
+                "- 문의/리뷰 관리\n"
+                "- 스토어 관리\n"
+                "- 혜택/마케팅\n"
+                "- 브랜드 혜택/마케팅\n"
+                "- 커머스 솔루션\n"
+                "- 통계\n"
+                "- 광고 관리\n"
+                "- 프로모션 관리\n"
+                "- 물류 관리\n"
+                "- 판매자 정보\n"
+                "판단 단계:\n"
+                "1. 주어진 FAQ를 검토하여 질문과 관련된 내용이 있는지 확인하세요.\n"
+                "2. 이전 대화 기록을 검토하여 질문의 맥락을 파악하세요.\n"
+                "3. direct: 질문이 위 주제들과 직접적으로 관련이 있는지 판단하세요.\n"
+                "4. indirect: 직접적인 언급이 없더라도 위 주제들과 간접적으로 연결될 수 있는지 분석하세요.\n\n"
+                "참고 사항:\n"
+                "- FAQ 내용: {context}\n"
+                "- 이전 대화 내용: {chat_history}\n\n"
+                "direct 신뢰도 점수 기준:\n"
+                "- 1.0: FAQ나 이전 대화에서 직접적인 답변이 있는 경우\n"
+                "- 0.7-0.9: 관련 내용이 있으나 완전히 일치하지 않는 경우\n"
+                "- 0.4-0.6: 유사한 맥락은 있으나 간접적인 경우\n"
+                "- 0.0-0.3: 관련성이 매우 낮거나 없는 경우\n\n"
+                "indirect 신뢰도 점수 기준:\n"
+                "- 0.7-1.0: 직접적인 언급은 없으나 매우 강한 연관성이 있는 경우\n"
+                "- 0.4-0.6: 중간 정도의 연관성이 있는 경우\n"
+                "- 0.0-0.3: 약한 연관성이 있거나 거의 없는 경우\n\n"
+                "응답 형식 (JSON):\n"
+                '{{"direct": {{"is_related": true, "confidence": 0.9}}, '
+                '"indirect": {{"is_related": true, "confidence": 0.7}}}}\n\n',
+            ),
+            Message(role="user", content="질문: {query}"),
+        ]
+    )
+
     PT_FAQ_QUESTION = PromptTemplate(
         [
             Message(
@@ -176,5 +222,22 @@ class PromptTemplates:
         ]
     )
 
+    PT_SUMMARIZE_HISTORY = PromptTemplate(
+        [
+            Message(
+                role="system",
+                content="당신은 네이버 스마트스토어 상담 대화를 요약하는 도우미입니다.\n"
+                "기존 요약과 이어지는 대화를 하나의 요약으로 합쳐주세요.\n\n"
+                "요약 규칙:\n"
+                "- 사용자가 물어본 주제와 핵심 질문을 빠짐없이 포함하세요\n"
+                "- 답변에서 안내한 주요 절차, 조건, 수치는 유지하세요\n"
+                "- 인사말, 반복된 내용, 후속 질문 제안은 제외하세요\n"
+                "- 5문장 이내의 한국어 평문으로 작성하세요\n\n"
+                "기존 요약:\n{summary}",
+            ),
+            Message(role="user", content="이어지는 대화:\n{chat_history}"),
+        ]
+    )
+
 
 prompts = PromptTemplates()
@@ -0,0 +1,26 @@
+from dataclasses import asdict, dataclass
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def to_dict(self) -> dict:
+        return {**asdict(self), "hit_rate": round(self.hit_rate, 4)}
+
+
+@dataclass
+class CachedAnswer:
+    query: str
+    query_embedding: list[float]
+    answer: str
+    follow_ups: list[str]
+    created_at: float
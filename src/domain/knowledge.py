@@ -1,4 +1,5 @@
-from dataclasses import dataclass
+import hashlib
+from dataclasses import dataclass, field
 
 from core.enums import CollectionType
 
@@ -8,6 +9,23 @@ class NaverFAQ:
     question: str
     answer: str
     tags: list[str]
+    # 답변을 나눈 passage (비어 있으면 적재 시 분할)
+    passages: list[str] = field(default_factory=list)
+
+    @property
+    def faq_id(self) -> str:
+        # 질문 내용 기반의 안정적인 ID (목록 내 위치와 무관)
+        return hashlib.sha1(self.question.encode("utf-8")).hexdigest()[:20]
+
+    @property
+    def category(self) -> str:
+        # 가장 앞의 태그를 검색 파티션(카테고리)으로 사용
+        return self.tags[0] if self.tags else ""
+
+    @property
+    def content_hash(self) -> str:
+        content = "\x00".join([self.question, self.answer, ",".join(self.tags)])
+        return hashlib.sha1(content.encode("utf-8")).hexdigest()
 
 
 @dataclass
@@ -16,3 +34,13 @@ class SearchResult:
     answer: str
     score: float
     collection_type: CollectionType
+    passage: str | None = None
+    passage_index: int | None = None
+
+
+@dataclass
+class IngestionReport:
+    added: int = 0
+    updated: int = 0
+    deleted: int = 0
+    unchanged: int = 0
@@ -0,0 +1,15 @@
+from dataclasses import dataclass, field
+
+
+@dataclass
+class ContextBudget:
+    context_tokens: int
+    history_tokens: int
+    max_answer_tokens: int
+
+
+@dataclass
+class PromptContext:
+    knowledge_context: str
+    chat_history: str
+    token_usage: dict[str, int] = field(default_factory=dict)
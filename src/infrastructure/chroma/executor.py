@@ -0,0 +1,79 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from functools import partial
+from time import perf_counter
+from typing import Any, Callable
+
+from core.config import settings
+
+
+@dataclass
+class ExecutorStats:
+    in_flight: int = 0
+    queued: int = 0
+    max_queue_depth: int = 0
+    completed: int = 0
+    total_wait_ms: float = 0.0
+
+    @property
+    def avg_wait_ms(self) -> float:
+        return self.total_wait_ms / self.completed if self.completed else 0.0
+
+    def to_dict(self) -> dict:
+        return {**asdict(self), "avg_wait_ms": round(self.avg_wait_ms, 2)}
+
+
+class ChromaExecutor:
+    """
+    동기 ChromaDB 호출을 이벤트 루프 밖에서 실행하기 위한 전용 스레드 풀
+    동시 실행 수를 제한하고 대기열 깊이를 기록
+    """
+
+    _instance = None
+
+    def __init__(self, max_workers: int):
+        self.max_workers = max_workers
+        self.stats = ExecutorStats()
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="chroma"
+        )
+        self._semaphore: asyncio.Semaphore | None = None
+
+    @classmethod
+    def get_instance(cls) -> "ChromaExecutor":
+        if cls._instance is None:
+            cls._instance = cls(max_workers=settings.CHROMA_EXECUTOR_MAX_WORKERS)
+        return cls._instance
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_workers)
+        return self._semaphore
+
+    async def run(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        start_time = perf_counter()
+        acquired = False
+        self.stats.queued += 1
+        self.stats.max_queue_depth = max(self.stats.max_queue_depth, self.stats.queued)
+
+        try:
+            async with self._get_semaphore():
+                acquired = True
+                self.stats.queued -= 1
+                self.stats.in_flight += 1
+                self.stats.total_wait_ms += (perf_counter() - start_time) * 1000
+                try:
+                    loop = asyncio.get_running_loop()
+                    return await loop.run_in_executor(
+                        self._executor, partial(func, *args, **kwargs)
+                    )
+                finally:
+                    self.stats.in_flight -= 1
+                    self.stats.completed += 1
+        finally:
+            if not acquired:
+                self.stats.queued -= 1
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
@@ -1,10 +1,43 @@
 from functools import lru_cache
+from typing import Literal
 
-from openai import AsyncOpenAI
+import httpx
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient
 
 from core.config import settings
+from infrastructure.openai.limiter import UpstreamLimiter
 
 
 @lru_cache()
 def get_openai_client() -> AsyncOpenAI:
-    return AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
+    # 재시도는 UpstreamLimiter에서 처리하므로 SDK 자체 재시도는 비활성화
+    return AsyncOpenAI(
+        api_key=settings.OPENAI_API_KEY,
+        max_retries=0,
+        http_client=DefaultAsyncHttpxClient(
+            limits=httpx.Limits(
+                max_connections=settings.OPENAI_MAX_CONNECTIONS,
+                max_keepalive_connections=settings.OPENAI_MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=settings.OPENAI_KEEPALIVE_EXPIRY,
+            ),
+            timeout=httpx.Timeout(
+                settings.OPENAI_TIMEOUT, connect=settings.OPENAI_CONNECT_TIMEOUT
+            ),
+        ),
+    )
+
+
+@lru_cache()
+def get_upstream_limiter(endpoint: Literal["chat", "embeddings"]) -> UpstreamLimiter:
+    max_concurrency = {
+        "chat": settings.OPENAI_CHAT_CONCURRENCY,
+        "embeddings": settings.OPENAI_EMBEDDING_CONCURRENCY,
+    }[endpoint]
+
+    return UpstreamLimiter(
+        name=endpoint,
+        max_concurrency=max_concurrency,
+        max_retries=settings.OPENAI_MAX_RETRIES,
+        base_delay=settings.OPENAI_RETRY_BASE_DELAY,
+        max_delay=settings.OPENAI_RETRY_MAX_DELAY,
+    )
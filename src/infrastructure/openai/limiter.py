@@ -0,0 +1,158 @@
+import asyncio
+import random
+from contextlib import asynccontextmanager
+from dataclasses import asdict, dataclass
+from time import perf_counter
+from typing import Any, AsyncIterator, Awaitable, Callable
+
+from openai import (
+    APIConnectionError,
+    APIStatusError,
+    APITimeoutError,
+    InternalServerError,
+    RateLimitError,
+)
+
+from core.logging import setup_logger
+
+logger = setup_logger(__name__)
+
+RETRYABLE_ERRORS = (
+    RateLimitError,
+    APITimeoutError,
+    APIConnectionError,
+    InternalServerError,
+)
+
+
+@dataclass
+class UpstreamStats:
+    in_flight: int = 0
+    queued: int = 0
+    max_queue_depth: int = 0
+    completed: int = 0
+    failed: int = 0
+    retries: int = 0
+    rate_limited: int = 0
+    total_wait_ms: float = 0.0
+
+    @property
+    def avg_wait_ms(self) -> float:
+        total = self.completed + self.failed
+        return self.total_wait_ms / total if total else 0.0
+
+    def to_dict(self) -> dict:
+        return {**asdict(self), "avg_wait_ms": round(self.avg_wait_ms, 2)}
+
+
+class UpstreamLimiter:
+    """
+    OpenAI 엔드포인트별 동시 요청 수 제한 및 재시도 처리
+    한도를 넘는 요청은 429를 연쇄적으로 받는 대신 대기열에서 순서를 기다림
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_concurrency: int,
+        max_retries: int,
+        base_delay: float,
+        max_delay: float,
+    ):
+        self.name = name
+        self.max_concurrency = max_concurrency
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.stats = UpstreamStats()
+        self._semaphore: asyncio.Semaphore | None = None
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphore
+
+    @asynccontextmanager
+    async def _acquire(self) -> AsyncIterator[None]:
+        start_time = perf_counter()
+        acquired = False
+        self.stats.queued += 1
+        self.stats.max_queue_depth = max(self.stats.max_queue_depth, self.stats.queued)
+
+        try:
+            async with self._get_semaphore():
+                acquired = True
+                self.stats.queued -= 1
+                self.stats.in_flight += 1
+                self.stats.total_wait_ms += (perf_counter() - start_time) * 1000
+                try:
+                    yield
+                finally:
+                    self.stats.in_flight -= 1
+        finally:
+            if not acquired:
+                self.stats.queued -= 1
+
+    def _get_retry_delay(self, attempt: int, error: Exception) -> float:
+        # full jitter 지수 백오프, 서버가 retry-after를 주면 그 이상 대기
+        delay = random.uniform(0, min(self.max_delay, self.base_delay * 2**attempt))
+
+        if isinstance(error, APIStatusError):
+            retry_after = error.response.headers.get("retry-after")
+            try:
+                delay = max(delay, float(retry_after))
+            except (TypeError, ValueError):
+                pass
+
+        return delay
+
+    async def _call_with_retry(
+        self, func: Callable[..., Awaitable[Any]], *args: Any, **kwargs: Any
+    ) -> Any:
+        for attempt in range(self.max_retries + 1):
+            try:
+                return await func(*args, **kwargs)
+            except RETRYABLE_ERRORS as e:
+                if isinstance(e, RateLimitError):
+                    self.stats.rate_limited += 1
+                if attempt == self.max_retries:
+                    raise
+
+                delay = self._get_retry_delay(attempt, e)
+                self.stats.retries += 1
+                logger.warning(
+                    f"[{self.name}] {type(e).__name__}, retrying in {delay:.2f}s "
+                    f"({attempt + 1}/{self.max_retries})"
+                )
+                await asyncio.sleep(delay)
+
+    async def call(
+        self, func: Callable[..., Awaitable[Any]], *args: Any, **kwargs: Any
+    ) -> Any:
+        async with self._acquire():
+            try:
+                result = await self._call_with_retry(func, *args, **kwargs)
+            except Exception:
+                self.stats.failed += 1
+                raise
+            self.stats.completed += 1
+            return result
+
+    async def stream(
+        self, func: Callable[..., Awaitable[Any]], *args: Any, **kwargs: Any
+    ) -> AsyncIterator[Any]:
+        """
+        스트리밍 응답은 마지막 청크를 받을 때까지 동시 실행 슬롯을 점유
+        """
+        async with self._acquire():
+            try:
+                response = await self._call_with_retry(func, *args, **kwargs)
+                try:
+                    async for chunk in response:
+                        yield chunk
+                finally:
+                    await response.close()
+            except Exception:
+                self.stats.failed += 1
+                raise
+            self.stats.completed += 1
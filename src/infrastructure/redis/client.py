@@ -7,6 +7,7 @@ from core.config import settings
 
 class RedisClient:
     _pool: ConnectionPool = None
+    _binary_pool: ConnectionPool = None
 
     @classmethod
     def get_pool(cls) -> ConnectionPool:
@@ -19,8 +20,34 @@ class RedisClient:
             )
         return cls._pool
 
+    @classmethod
+    def get_binary_pool(cls) -> ConnectionPool:
+        # 임베딩 벡터 등 바이너리 값을 그대로 주고받기 위한 별도 풀
+        if cls._binary_pool is None:
+            cls._binary_pool = ConnectionPool(
+                host=settings.REDIS_HOST,
+                port=settings.REDIS_PORT,
+                db=settings.REDIS_DB,
+                decode_responses=False,
+            )
+        return cls._binary_pool
+
     @classmethod
     @asynccontextmanager
     async def get_connection(cls):
         async with Redis(connection_pool=cls.get_pool()) as redis:
             yield redis
+
+    @classmethod
+    @asynccontextmanager
+    async def get_binary_connection(cls):
+        async with Redis(connection_pool=cls.get_binary_pool()) as redis:
+            yield redis
+
+    @classmethod
+    async def close(cls) -> None:
+        for pool in (cls._pool, cls._binary_pool):
+            if pool is not None:
+                await pool.disconnect()
+        cls._pool = None
+        cls._binary_pool = None
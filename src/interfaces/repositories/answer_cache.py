@@ -0,0 +1,30 @@
+from abc import ABC, abstractmethod
+
+from domain.cache import CachedAnswer
+
+
+class AnswerCacheRepository(ABC):
+    @abstractmethod
+    async def find(
+        self,
+        query_embedding: list[float],
+        similar_faqs: list[dict],
+        corpus_version: str,
+    ) -> CachedAnswer | None:
+        pass
+
+    @abstractmethod
+    async def save(
+        self,
+        query: str,
+        query_embedding: list[float],
+        similar_faqs: list[dict],
+        corpus_version: str,
+        answer: str,
+        follow_ups: list[str],
+    ) -> None:
+        pass
+
+    @abstractmethod
+    async def invalidate(self) -> None:
+        pass
@@ -0,0 +1,11 @@
+from abc import ABC, abstractmethod
+
+
+class EmbeddingCacheRepository(ABC):
+    @abstractmethod
+    async def get(self, text: str, model_name: str) -> list[float] | None:
+        pass
+
+    @abstractmethod
+    async def set(self, text: str, model_name: str, embedding: list[float]) -> None:
+        pass
@@ -1,15 +1,45 @@
 from abc import ABC, abstractmethod
+from typing import Iterable
 
-from domain.knowledge import NaverFAQ
+from domain.knowledge import IngestionReport, NaverFAQ
 
 
 class KnowledgeBaseRepository(ABC):
+    @abstractmethod
+    async def embed_query(self, query: str) -> list[float]:
+        pass
+
+    @abstractmethod
+    async def get_cached_query_embedding(self, query: str) -> list[float] | None:
+        pass
+
     @abstractmethod
     async def find_similar(
-        self, query: str, limit: int = 3, distance_threshold: float = 0.5
+        self,
+        query: str,
+        limit: int = 3,
+        distance_threshold: float = 0.5,
+        query_embedding: list[float] | None = None,
+        tags: list[str] | None = None,
     ) -> list[dict]:
         pass
 
+    @abstractmethod
+    async def predict_tags(
+        self,
+        query_embedding: list[float],
+        history_embeddings: list[list[float]] | None = None,
+    ) -> list[str] | None:
+        pass
+
+    @abstractmethod
+    async def get_corpus_version(self) -> str:
+        pass
+
     @abstractmethod
     async def bulk_add_faqs(self, faqs: list[NaverFAQ]) -> None:
         pass
+
+    @abstractmethod
+    async def sync_faqs(self, faqs: Iterable[NaverFAQ]) -> IngestionReport:
+        pass
@@ -5,7 +5,12 @@ from domain.chat import Message
 
 class ChatMemoryRepository(ABC):
     @abstractmethod
-    async def save_message(self, session_id: str, message: Message) -> None:
+    async def save_message(
+        self,
+        session_id: str,
+        message: Message,
+        publish: tuple[str, str] | None = None,
+    ) -> None:
         pass
 
     @abstractmethod
@@ -13,3 +18,23 @@ class ChatMemoryRepository(ABC):
         self, session_id: str, limit: int = 10
     ) -> list[Message]:
         pass
+
+    @abstractmethod
+    async def compact_history(
+        self,
+        session_id: str,
+        summary: str,
+        summarized_messages: list[Message],
+        publish: tuple[str, str] | None = None,
+    ) -> bool:
+        pass
+
+    @abstractmethod
+    async def append_turn(
+        self,
+        session_id: str,
+        messages: list[Message],
+        limit: int = 10,
+        publish: tuple[str, str] | None = None,
+    ) -> list[Message]:
+        pass
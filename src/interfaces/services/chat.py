@@ -2,6 +2,7 @@ from abc import ABC, abstractmethod
 from typing import AsyncGenerator
 
 from domain.chat import ChatResponse
+from domain.prompt import PromptContext
 
 
 class ChatService(ABC):
@@ -29,6 +30,6 @@ class ChatService(ABC):
 
     @abstractmethod
     async def create_chat_completion(
-        self, query: str, chat_history: list[str], knowledge_context: str
+        self, query: str, prompt_context: PromptContext
     ) -> AsyncGenerator[str, None]:
         pass
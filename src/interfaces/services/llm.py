@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
+from typing import AsyncIterator
 
-from openai import AsyncStream
 from openai.types.chat import ChatCompletion, ChatCompletionChunk
 
 
@@ -11,5 +11,6 @@ class LLMService(ABC):
         messages: list[dict[str, str]],
         temperature: float = 0.7,
         stream: bool = False,
-    ) -> ChatCompletion | AsyncStream[ChatCompletionChunk] | str:
+        response_format: dict | None = None,
+    ) -> ChatCompletion | AsyncIterator[ChatCompletionChunk] | str:
         pass
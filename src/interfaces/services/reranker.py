@@ -0,0 +1,9 @@
+from abc import ABC, abstractmethod
+
+
+class RerankerService(ABC):
+    @abstractmethod
+    async def rerank(
+        self, query: str, candidates: list[dict], limit: int
+    ) -> list[dict]:
+        pass
@@ -0,0 +1,13 @@
+from abc import ABC, abstractmethod
+
+from domain.chat import Message
+
+
+class ChatSummaryService(ABC):
+    @abstractmethod
+    def schedule_compaction(self, session_id: str, chat_history: list[Message]) -> None:
+        pass
+
+    @abstractmethod
+    async def close(self) -> None:
+        pass
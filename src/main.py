@@ -6,6 +6,7 @@ from starlette.staticfiles import StaticFiles
 from starlette.templating import Jinja2Templates
 
 from api.v1.router import api_v1_router
+from container import ServiceContainer
 from core.config import settings
 from core.logging import setup_logger
 from middleware.logging import LoggingMiddleware
@@ -22,8 +23,14 @@ async def lifespan(app: FastAPI):
             "ChromaDB persistence directory not found. "
             "Please run 'make pre-start' first to process and load the data."
         )
+
+    container = ServiceContainer.build()
+    await container.warm_up()
+    app.state.container = container
+
     yield
     logger.info("Service is shutting down ...")
+    await container.close()
 
 
 app = FastAPI(
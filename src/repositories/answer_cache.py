@@ -0,0 +1,118 @@
+import hashlib
+import math
+from time import monotonic
+
+from core.config import settings
+from core.logging import setup_logger
+from domain.cache import CachedAnswer, CacheStats
+from interfaces.repositories.answer_cache import AnswerCacheRepository
+from utils.cache import TTLCache
+
+logger = setup_logger(__name__)
+
+
+def _cosine_similarity(a: list[float], b: list[float]) -> float:
+    dot = sum(x * y for x, y in zip(a, b))
+    norm = math.sqrt(sum(x * x for x in a)) * math.sqrt(sum(y * y for y in b))
+    return dot / norm if norm else 0.0
+
+
+class SemanticAnswerCacheRepository(AnswerCacheRepository):
+    """
+    쿼리 임베딩 유사도로 이전 답변을 재사용하는 프로세스 내 시맨틱 캐시
+    캐시 항목은 검색된 FAQ 집합(질문/답변 내용) 단위로 분리되므로
+    FAQ 내용이 바뀌면 기존 항목은 더 이상 조회되지 않음
+    """
+
+    def __init__(
+        self,
+        similarity_threshold: float = None,
+        max_size: int = None,
+        ttl: int = None,
+        max_entries_per_scope: int = 10,
+    ):
+        self.similarity_threshold = (
+            similarity_threshold or settings.ANSWER_CACHE_SIMILARITY_THRESHOLD
+        )
+        self.ttl = ttl or settings.ANSWER_CACHE_TTL
+        self.max_entries_per_scope = max_entries_per_scope
+        self.scopes: TTLCache[str, list[CachedAnswer]] = TTLCache(
+            max_size=max_size or settings.ANSWER_CACHE_MAX_SIZE, ttl=self.ttl
+        )
+        self.stats = CacheStats()
+        self.corpus_version: str | None = None
+
+    def _get_scope_key(self, similar_faqs: list[dict]) -> str:
+        pairs = sorted(f"{faq['question']}\n{faq['answer']}" for faq in similar_faqs)
+        return hashlib.sha1("\x00".join(pairs).encode("utf-8")).hexdigest()
+
+    async def _check_corpus_version(self, corpus_version: str) -> None:
+        if self.corpus_version != corpus_version:
+            if self.corpus_version is not None:
+                logger.info("FAQ corpus changed, invalidating answer cache")
+            await self.invalidate()
+            self.corpus_version = corpus_version
+
+    async def find(
+        self,
+        query_embedding: list[float],
+        similar_faqs: list[dict],
+        corpus_version: str,
+    ) -> CachedAnswer | None:
+        await self._check_corpus_version(corpus_version)
+
+        entries = self.scopes.get(self._get_scope_key(similar_faqs)) or []
+        now = monotonic()
+
+        best_entry, best_similarity = None, self.similarity_threshold
+        for entry in entries:
+            if now - entry.created_at > self.ttl:
+                continue
+            similarity = _cosine_similarity(query_embedding, entry.query_embedding)
+            if similarity >= best_similarity:
+                best_entry, best_similarity = entry, similarity
+
+        if best_entry is None:
+            self.stats.misses += 1
+            return None
+
+        self.stats.hits += 1
+        logger.debug(
+            f"Answer cache hit (similarity={best_similarity:.3f}): {best_entry.query}"
+        )
+        return best_entry
+
+    async def save(
+        self,
+        query: str,
+        query_embedding: list[float],
+        similar_faqs: list[dict],
+        corpus_version: str,
+        answer: str,
+        follow_ups: list[str],
+    ) -> None:
+        await self._check_corpus_version(corpus_version)
+
+        scope_key = self._get_scope_key(similar_faqs)
+        now = monotonic()
+        entries = [
+            entry
+            for entry in self.scopes.get(scope_key) or []
+            if now - entry.created_at <= self.ttl
+        ]
+        entries.append(
+            CachedAnswer(
+                query=query,
+                query_embedding=query_embedding,
+                answer=answer,
+                follow_ups=follow_ups,
+                created_at=now,
+            )
+        )
+
+        evicted = max(0, len(entries) - self.max_entries_per_scope)
+        self.stats.evictions += evicted
+        self.scopes.set(scope_key, entries[evicted:])
+
+    async def invalidate(self) -> None:
+        self.scopes.clear()
@@ -0,0 +1,108 @@
+import hashlib
+import re
+import unicodedata
+from array import array
+
+from redis.exceptions import RedisError
+
+from core.config import settings
+from core.logging import setup_logger
+from domain.cache import CacheStats
+from infrastructure.redis.client import RedisClient
+from interfaces.repositories.embedding import EmbeddingCacheRepository
+from utils.cache import TTLCache
+
+logger = setup_logger(__name__)
+
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+_TRAILING_PUNCTUATION_PATTERN = re.compile(r"[\s?!.~]+$")
+
+
+def normalize_query(text: str) -> str:
+    """
+    반복/유사 질문이 같은 키를 갖도록 쿼리 텍스트를 정규화
+    예: " 정산  언제 되나요?? " -> "정산 언제 되나요"
+    """
+    text = unicodedata.normalize("NFKC", text).lower()
+    text = _WHITESPACE_PATTERN.sub(" ", text).strip()
+    return _TRAILING_PUNCTUATION_PATTERN.sub("", text)
+
+
+class TieredEmbeddingCacheRepository(EmbeddingCacheRepository):
+    """
+    프로세스 내 LRU 캐시와 (선택적으로) Redis 공유 캐시로 구성된 쿼리 임베딩 캐시
+    Redis에는 float32 바이트로 압축하여 저장
+    """
+
+    def __init__(
+        self,
+        max_size: int = None,
+        ttl: int = None,
+        redis_enabled: bool = None,
+        redis_ttl: int = None,
+    ):
+        self.local_cache: TTLCache[str, list[float]] = TTLCache(
+            max_size=max_size or settings.EMBEDDING_CACHE_MAX_SIZE,
+            ttl=ttl or settings.EMBEDDING_CACHE_TTL,
+        )
+        self.redis_enabled = (
+            settings.EMBEDDING_CACHE_REDIS_ENABLED
+            if redis_enabled is None
+            else redis_enabled
+        )
+        self.redis_ttl = redis_ttl or settings.EMBEDDING_CACHE_REDIS_TTL
+        self.redis_stats = CacheStats()
+
+    @property
+    def stats(self) -> CacheStats:
+        return self.local_cache.stats
+
+    def _get_key(self, text: str, model_name: str) -> str:
+        digest = hashlib.sha1(normalize_query(text).encode("utf-8")).hexdigest()
+        return f"embedding:{model_name}:{digest}"
+
+    @staticmethod
+    def _encode(embedding: list[float]) -> bytes:
+        return array("f", embedding).tobytes()
+
+    @staticmethod
+    def _decode(data: bytes) -> list[float]:
+        values = array("f")
+        values.frombytes(data)
+        return values.tolist()
+
+    async def get(self, text: str, model_name: str) -> list[float] | None:
+        key = self._get_key(text, model_name)
+
+        embedding = self.local_cache.get(key)
+        if embedding is not None or not self.redis_enabled:
+            return embedding
+
+        try:
+            async with RedisClient.get_binary_connection() as redis:
+                data = await redis.get(key)
+        except RedisError as e:
+            logger.warning(f"Embedding cache lookup failed: {str(e)}")
+            return None
+
+        if data is None:
+            self.redis_stats.misses += 1
+            return None
+
+        self.redis_stats.hits += 1
+        embedding = self._decode(data)
+        self.local_cache.set(key, embedding)
+        return embedding
+
+    async def set(self, text: str, model_name: str, embedding: list[float]) -> None:
+        key = self._get_key(text, model_name)
+        self.local_cache.set(key, embedding)
+
+        if not self.redis_enabled:
+            return
+
+        try:
+            async with RedisClient.get_binary_connection() as redis:
+                await redis.set(key, self._encode(embedding), ex=self.redis_ttl)
+        except RedisError as e:
+            logger.warning(f"Embedding cache store failed: {str(e)}")
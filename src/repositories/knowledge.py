@@ -1,4 +1,8 @@
 import asyncio
+import hashlib
+from itertools import batched
+from time import monotonic, perf_counter
+from typing import Iterable
 
 from chromadb.utils.embedding_functions import DefaultEmbeddingFunction
 from chromadb.utils.embedding_functions.openai_embedding_function import (
@@ -9,16 +13,30 @@ from core.config import settings
 from core.decorators import log_execution_time
 from core.enums import CollectionType
 from core.logging import setup_logger
-from domain.knowledge import NaverFAQ, SearchResult
+from domain.knowledge import IngestionReport, NaverFAQ, SearchResult
 from infrastructure.chroma.client import ChromaClient
+from infrastructure.chroma.executor import ChromaExecutor
+from infrastructure.openai.client import get_openai_client, get_upstream_limiter
+from interfaces.repositories.embedding import EmbeddingCacheRepository
 from interfaces.repositories.knowledge import KnowledgeBaseRepository
+from repositories.lexical import BM25Index
+from repositories.tag_router import TagRouter
+from utils.text import split_passages
+from utils.tokens import count_tokens
 
 logger = setup_logger(__name__)
 
 
 class ChromaKnowledgeRepository(KnowledgeBaseRepository):
-    def __init__(self):
+    def __init__(self, embedding_cache: EmbeddingCacheRepository | None = None):
         self.client = ChromaClient.get_instance()
+        self.executor = ChromaExecutor.get_instance()
+        self.embedding_cache = embedding_cache
+        self.embedding_model_name = (
+            settings.OPENAI_EMBEDDING_MODEL
+            if settings.EMBEDDING_MODE == "openai"
+            else "all-MiniLM-L6-v2"
+        )
         self.embedding_function = (
             OpenAIEmbeddingFunction(
                 api_key=settings.OPENAI_API_KEY,
@@ -27,12 +45,25 @@ class ChromaKnowledgeRepository(KnowledgeBaseRepository):
             if settings.EMBEDDING_MODE == "openai"
             else DefaultEmbeddingFunction()
         )
+        # passage 분할 설정이 바뀌면 기존 FAQ도 다시 적재되도록 메타데이터에 기록
+        self.passage_schema = (
+            f"{settings.PASSAGE_MAX_TOKENS}:{settings.PASSAGE_OVERLAP_TOKENS}"
+        )
         self.collections = self._initialize_collections()
+        self.corpus_version = self._load_corpus_version()
+        self.corpus_version_refreshed_at = monotonic()
+        self.lexical_index = (
+            self._load_lexical_index() if settings.HYBRID_SEARCH_ENABLED else None
+        )
+        self.tag_router = (
+            self._load_tag_router() if settings.TAG_ROUTING_ENABLED else None
+        )
         self.weights = {
             CollectionType.FULL: 1.0,
             CollectionType.QUESTION: 0.8,
             CollectionType.ANSWER: 0.6,
         }
+        self.lexical_weight = settings.LEXICAL_WEIGHT
 
     def _initialize_collections(self) -> dict:
         collections = {}
@@ -44,37 +75,183 @@ class ChromaKnowledgeRepository(KnowledgeBaseRepository):
             )
         return collections
 
+    def _load_corpus_version(self) -> str:
+        metadata = self.collections[CollectionType.FULL].metadata or {}
+        return metadata.get("corpus_version", "")
+
+    def _load_lexical_index(self) -> BM25Index | None:
+        """
+        prestart가 생성한 BM25 색인이 현재 컬렉션과 일치하면 이를 사용
+        """
+        lexical_index = BM25Index.load(settings.LEXICAL_INDEX_PATH)
+        if lexical_index is None:
+            logger.warning(
+                f"BM25 index not found at {settings.LEXICAL_INDEX_PATH}, "
+                "using vector search only"
+            )
+            return None
+
+        if lexical_index.corpus_version != self.corpus_version:
+            logger.warning(
+                "BM25 index does not match the current collections, "
+                "using vector search only"
+            )
+            return None
+
+        return lexical_index
+
+    def save_lexical_index(self, faqs: list[NaverFAQ]) -> None:
+        self.lexical_index = BM25Index.build(faqs, corpus_version=self.corpus_version)
+        self.lexical_index.save(settings.LEXICAL_INDEX_PATH)
+
+    def _load_tag_router(self) -> TagRouter | None:
+        tag_router = TagRouter.load(settings.TAG_ROUTER_PATH)
+        if tag_router is None or (
+            tag_router.corpus_version != self.corpus_version
+            or tag_router.embedding_model != self.embedding_model_name
+        ):
+            logger.warning(
+                "FAQ category centroids are missing or stale, tag routing disabled"
+            )
+            return None
+
+        return tag_router
+
+    async def save_tag_router(self) -> None:
+        records = await self.executor.run(
+            self.collections[CollectionType.FULL].get,
+            include=["embeddings", "metadatas"],
+        )
+        self.tag_router = TagRouter.build(
+            row_tags=[
+                self._get_category(metadata) for metadata in records["metadatas"]
+            ],
+            embeddings=records["embeddings"],
+            corpus_version=self.corpus_version,
+            embedding_model=self.embedding_model_name,
+        )
+        self.tag_router.save(settings.TAG_ROUTER_PATH)
+
+    async def predict_tags(
+        self,
+        query_embedding: list[float],
+        history_embeddings: list[list[float]] | None = None,
+    ) -> list[str] | None:
+        if self.tag_router is None:
+            return None
+
+        return self.tag_router.predict(
+            query_embedding,
+            history_embeddings,
+            history_weight=settings.TAG_ROUTING_HISTORY_WEIGHT,
+            max_tags=settings.TAG_ROUTING_MAX_TAGS,
+            min_similarity=settings.TAG_ROUTING_MIN_SIMILARITY,
+            margin=settings.TAG_ROUTING_MARGIN,
+        )
+
+    async def get_corpus_version(self) -> str:
+        # prestart 등 다른 프로세스가 갱신한 버전을 반영하도록 주기적으로 메타데이터를 다시 읽음
+        if (
+            monotonic() - self.corpus_version_refreshed_at
+            >= settings.CORPUS_VERSION_REFRESH_INTERVAL
+        ):
+            self.corpus_version_refreshed_at = monotonic()
+            try:
+                collection = await self.executor.run(
+                    self.client.get_collection,
+                    name=self.collections[CollectionType.FULL].name,
+                    embedding_function=self.embedding_function,
+                )
+                self.corpus_version = (collection.metadata or {}).get(
+                    "corpus_version", ""
+                )
+            except Exception as e:
+                logger.warning(f"Failed to refresh corpus version: {str(e)}")
+        return self.corpus_version
+
+    @log_execution_time
+    async def embed_query(self, query: str) -> list[float]:
+        if self.embedding_cache is not None:
+            cached = await self.embedding_cache.get(query, self.embedding_model_name)
+            if cached is not None:
+                return cached
+
+        embedding = await self._compute_query_embedding(query)
+
+        if self.embedding_cache is not None:
+            await self.embedding_cache.set(query, self.embedding_model_name, embedding)
+        return embedding
+
+    async def get_cached_query_embedding(self, query: str) -> list[float] | None:
+        # 임베딩을 새로 계산하지 않고 캐시에 있는 경우에만 반환
+        if self.embedding_cache is None:
+            return None
+        return await self.embedding_cache.get(query, self.embedding_model_name)
+
+    async def _compute_query_embedding(self, query: str) -> list[float]:
+        # openai 모드는 공유 연결 풀과 동시 요청 제한을 거치는 비동기 클라이언트 사용
+        if settings.EMBEDDING_MODE == "openai":
+            response = await get_upstream_limiter("embeddings").call(
+                get_openai_client().embeddings.create,
+                model=settings.OPENAI_EMBEDDING_MODEL,
+                input=[query],
+            )
+            return response.data[0].embedding
+
+        embeddings = await self.executor.run(self.embedding_function, [query])
+        return [float(value) for value in embeddings[0]]
+
     @log_execution_time
     async def find_similar(
-        self, query: str, limit: int = 3, distance_threshold: float = 1.0
+        self,
+        query: str,
+        limit: int = 3,
+        distance_threshold: float = 1.0,
+        query_embedding: list[float] | None = None,
+        tags: list[str] | None = None,
     ) -> list[dict]:
+        # 쿼리 임베딩은 한 번만 계산하여 모든 컬렉션 검색에 공유
+        if query_embedding is None:
+            query_embedding = await self.embed_query(query)
+
         search_tasks = [
             self._search_collection(
                 collection_type=col_type,
-                query_text=query,
+                query_embedding=query_embedding,
                 limit=limit,
                 threshold=distance_threshold,
+                tags=tags,
             )
             for col_type in CollectionType
         ]
 
         results = await asyncio.gather(*search_tasks)
 
-        weighted_results = self._combine_results(results)
+        weighted_results = self._combine_results(
+            results, self._search_lexical(query, limit, tags)
+        )
 
         return weighted_results[:limit]
 
     async def _search_collection(
         self,
         collection_type: CollectionType,
-        query_text: str,
+        query_embedding: list[float],
         limit: int,
         threshold: float,
+        tags: list[str] | None = None,
     ) -> list[SearchResult]:
         collection = self.collections[collection_type]
-        results = collection.query(
-            query_texts=[query_text],
+        if collection_type != CollectionType.QUESTION:
+            limit *= settings.PASSAGE_SEARCH_MULTIPLIER
+        # 예측된 카테고리와 태그 없는 FAQ로 검색 범위를 제한
+        where = {"category": {"$in": [*tags, ""]}} if tags else None
+        # 동기 query 호출을 전용 스레드 풀에서 실행하여 컬렉션 검색이 실제로 병렬 수행되도록 함
+        results = await self.executor.run(
+            collection.query,
+            query_embeddings=[query_embedding],
             n_results=limit,
+            where=where,
             include=["metadatas", "distances"],
         )
 
@@ -91,62 +268,335 @@ class ChromaKnowledgeRepository(KnowledgeBaseRepository):
                     answer=metadata["answer"],
                     score=1 - distance,
                     collection_type=collection_type,
+                    passage=metadata.get("passage"),
+                    passage_index=metadata.get("passage_index"),
                 )
             )
 
         return search_results
 
-    def _combine_results(self, results: list[list[SearchResult]]) -> list[dict]:
-        combined_scores = {}
+    def _search_lexical(
+        self, query: str, limit: int, tags: list[str] | None = None
+    ) -> list[tuple[str, str, float]]:
+        if self.lexical_index is None:
+            return []
+        return self.lexical_index.search(query, limit, tags)
+
+    def _combine_results(
+        self,
+        results: list[list[SearchResult]],
+        lexical_results: list[tuple[str, str, float]] | None = None,
+    ) -> list[dict]:
+        # 한 FAQ의 여러 passage가 검색되면 뷰별 최고 점수만 반영하고 passage는 모아둠
+        view_scores: dict[tuple[str, str], dict[CollectionType, float]] = {}
+        matched_passages: dict[tuple[str, str], dict[int, str]] = {}
         for result_group in results:
             for result in result_group:
                 key = (result.question, result.answer)
-                weight = self.weights[result.collection_type]
-                if key not in combined_scores:
-                    combined_scores[key] = 0
-                combined_scores[key] += result.score * weight
+                scores = view_scores.setdefault(key, {})
+                scores[result.collection_type] = max(
+                    scores.get(result.collection_type, float("-inf")), result.score
+                )
+                if result.passage is not None:
+                    matched_passages.setdefault(key, {})[
+                        result.passage_index
+                    ] = result.passage
+
+        combined_scores = {
+            key: sum(
+                score * self.weights[collection_type]
+                for collection_type, score in scores.items()
+            )
+            for key, scores in view_scores.items()
+        }
+
+        # BM25 점수(0~1로 정규화)를 가중 합산, 벡터 검색에서 빠진 FAQ도 후보에 포함
+        for question, answer, score in lexical_results or []:
+            key = (question, answer)
+            if key not in combined_scores:
+                combined_scores[key] = 0
+            combined_scores[key] += score * self.lexical_weight
 
         sorted_results = sorted(
             combined_scores.items(), key=lambda x: x[1], reverse=True
         )
 
         return [
-            {"question": question, "answer": answer, "score": score}
+            {
+                "question": question,
+                "answer": answer,
+                "score": score,
+                "passages": [
+                    passage
+                    for _, passage in sorted(
+                        matched_passages.get((question, answer), {}).items()
+                    )
+                ],
+            }
             for (question, answer), score in sorted_results
         ]
 
     @log_execution_time
     async def bulk_add_faqs(self, faqs: list[NaverFAQ]) -> None:
+        await self._upsert_faqs(faqs)
+
+        stored_hashes = await self._get_stored_content_hashes()
+        await self._update_corpus_version(list(stored_hashes.values()))
+
+    @log_execution_time
+    async def sync_faqs(self, faqs: Iterable[NaverFAQ]) -> IngestionReport:
+        """
+        저장된 FAQ와 content hash를 비교하여 신규/변경 항목만 임베딩 및 upsert하고
+        더 이상 없는 항목은 삭제
+        입력은 chunk 단위로 소비되므로 전처리 결과를 스트리밍으로 넘길 수 있음
+        """
+        stored_hashes = await self._get_stored_content_hashes()
+        desired_hashes: dict[str, str] = {}
+
+        report = IngestionReport()
+        for chunk in batched(faqs, settings.FAQ_SYNC_CHUNK_SIZE):
+            changed_faqs = []
+            for faq in chunk:
+                if faq.faq_id in desired_hashes:
+                    continue
+                desired_hashes[faq.faq_id] = faq.content_hash
+
+                stored_hash = stored_hashes.get(faq.faq_id)
+                if stored_hash == faq.content_hash:
+                    report.unchanged += 1
+                    continue
+
+                if stored_hash is None:
+                    report.added += 1
+                else:
+                    report.updated += 1
+                changed_faqs.append(faq)
+
+            await self._upsert_faqs(changed_faqs)
+
         for collection_type in CollectionType:
-            documents = []
-            metadatas = []
-            ids = []
-
-            for i, faq in enumerate(faqs):
-                doc_content = self._get_document_content(faq, collection_type)
-                documents.append(doc_content)
-                metadatas.append(
+            collection = self.collections[collection_type]
+            stored_ids = (await self.executor.run(collection.get, include=[]))["ids"]
+            stale_ids = [
+                stored_id
+                for stored_id in stored_ids
+                if self._parse_faq_id(collection_type, stored_id) not in desired_hashes
+            ]
+            if collection_type == CollectionType.FULL:
+                # FULL 뷰는 passage마다 행이 있으므로 FAQ 단위로 집계
+                report.deleted = len(
                     {
-                        "question": faq.question,
-                        "answer": faq.answer,
-                        "tags": ",".join(faq.tags),
+                        self._parse_faq_id(collection_type, stale_id)
+                        for stale_id in stale_ids
                     }
                 )
-                ids.append(f"{collection_type.value}_{i}")
+            if stale_ids:
+                await self.executor.run(collection.delete, ids=stale_ids)
+
+        await self._update_corpus_version(list(desired_hashes.values()))
+
+        logger.info(
+            f"FAQ sync finished: {report.added} added, {report.updated} updated, "
+            f"{report.deleted} deleted, {report.unchanged} unchanged"
+        )
+        return report
+
+    async def get_all_faqs(self) -> list[NaverFAQ]:
+        records = await self.executor.run(
+            self.collections[CollectionType.FULL].get, include=["metadatas"]
+        )
+        # FULL 컬렉션에는 FAQ당 passage 수만큼 행이 있으므로 faq_id로 중복 제거
+        metadatas = {metadata["faq_id"]: metadata for metadata in records["metadatas"]}
+        return [
+            NaverFAQ(
+                question=metadata["question"],
+                answer=metadata["answer"],
+                tags=metadata["tags"].split(",") if metadata.get("tags") else [],
+            )
+            for metadata in metadatas.values()
+        ]
+
+    @staticmethod
+    def _get_category(metadata: dict) -> str:
+        if "category" in metadata:
+            return metadata["category"]
+        return (metadata.get("tags") or "").split(",")[0]
+
+    async def _get_stored_content_hashes(self) -> dict[str, str]:
+        records = await self.executor.run(
+            self.collections[CollectionType.FULL].get, include=["metadatas"]
+        )
+        # passage 분할 설정이 다른 FAQ는 내용이 같아도 변경된 것으로 취급
+        return {
+            metadata["faq_id"]: (
+                metadata["content_hash"]
+                if metadata.get("passage_schema") == self.passage_schema
+                else ""
+            )
+            for metadata in records["metadatas"]
+            if metadata and "content_hash" in metadata
+        }
+
+    @staticmethod
+    def _parse_faq_id(collection_type: CollectionType, stored_id: str) -> str:
+        # id 형식: {view}_{faq_id} 또는 {view}_{faq_id}_{passage_index}
+        return stored_id.removeprefix(f"{collection_type.value}_").split("_")[0]
+
+    async def _update_corpus_version(self, content_hashes: list[str]) -> None:
+        # 적재된 FAQ 내용으로 버전을 갱신하여 답변 캐시 등이 변경을 감지할 수 있도록 함
+        digest = hashlib.sha1(self.passage_schema.encode("utf-8"))
+        for content_hash in sorted(content_hashes):
+            digest.update(content_hash.encode("utf-8"))
+        self.corpus_version = digest.hexdigest()
+        await self.executor.run(
+            self.collections[CollectionType.FULL].modify,
+            metadata={"corpus_version": self.corpus_version},
+        )
 
+    @log_execution_time
+    async def _upsert_faqs(self, faqs: list[NaverFAQ]) -> None:
+        if not faqs:
+            return
+
+        # 뷰별 (documents, metadatas, ids), QUESTION은 FAQ당 1개, FULL/ANSWER는 passage당 1개
+        view_records = {
+            collection_type: ([], [], []) for collection_type in CollectionType
+        }
+        for faq in faqs:
+            metadata = {
+                "faq_id": faq.faq_id,
+                "content_hash": faq.content_hash,
+                "passage_schema": self.passage_schema,
+                "question": faq.question,
+                "answer": faq.answer,
+                "tags": ",".join(faq.tags),
+                "category": faq.category,
+            }
+            for collection_type, (documents, metadatas, ids) in view_records.items():
+                if collection_type == CollectionType.QUESTION:
+                    documents.append(self._get_document_content(faq, collection_type))
+                    metadatas.append(metadata)
+                    ids.append(f"{collection_type.value}_{faq.faq_id}")
+                    continue
+
+                for i, passage in enumerate(self._get_passages(faq)):
+                    documents.append(
+                        self._get_document_content(faq, collection_type, passage)
+                    )
+                    metadatas.append(
+                        {**metadata, "passage": passage, "passage_index": i}
+                    )
+                    ids.append(f"{collection_type.value}_{faq.faq_id}_{i}")
+
+        view_documents = {
+            collection_type: documents
+            for collection_type, (documents, _, _) in view_records.items()
+        }
+
+        # 세 컬렉션에서 중복되는 텍스트는 한 번만 임베딩
+        unique_texts = list(
+            dict.fromkeys(
+                text for documents in view_documents.values() for text in documents
+            )
+        )
+        start_time = perf_counter()
+        embeddings = dict(zip(unique_texts, await self._embed_documents(unique_texts)))
+        total_documents = sum(len(documents) for documents in view_documents.values())
+        logger.info(
+            f"Embedded {len(unique_texts)} unique texts for {total_documents} "
+            f"documents in {perf_counter() - start_time:.2f}s"
+        )
+
+        faq_ids = [faq.faq_id for faq in faqs]
+        for collection_type, (documents, metadatas, ids) in view_records.items():
+            # passage 수가 줄어든 FAQ의 남는 passage(및 이전 형식의 문서)를 먼저 삭제
+            if collection_type != CollectionType.QUESTION:
+                await self.executor.run(
+                    self.collections[collection_type].delete,
+                    where={"faq_id": {"$in": faq_ids}},
+                )
             await self._batch_add_to_collection(
-                collection_type, documents, metadatas, ids
+                collection_type,
+                documents,
+                [embeddings[document] for document in documents],
+                metadatas,
+                ids,
             )
 
+    async def _embed_documents(self, texts: list[str]) -> list[list[float]]:
+        """
+        토큰 수 기준으로 배치를 나누고 제한된 수의 요청을 동시에 보내 임베딩
+        """
+        batches = self._split_embedding_batches(texts)
+        semaphore = asyncio.Semaphore(settings.EMBEDDING_INGEST_CONCURRENCY)
+
+        async def embed_batch(batch: list[str]) -> list[list[float]]:
+            async with semaphore:
+                if settings.EMBEDDING_MODE == "openai":
+                    response = await get_upstream_limiter("embeddings").call(
+                        get_openai_client().embeddings.create,
+                        model=settings.OPENAI_EMBEDDING_MODEL,
+                        input=batch,
+                    )
+                    return [
+                        item.embedding
+                        for item in sorted(response.data, key=lambda x: x.index)
+                    ]
+
+                embeddings = await self.executor.run(self.embedding_function, batch)
+                return [
+                    [float(value) for value in embedding] for embedding in embeddings
+                ]
+
+        logger.info(
+            f"Embedding {len(texts)} texts in {len(batches)} batches "
+            f"(concurrency={settings.EMBEDDING_INGEST_CONCURRENCY})"
+        )
+        results = await asyncio.gather(*[embed_batch(batch) for batch in batches])
+        return [embedding for batch_result in results for embedding in batch_result]
+
+    def _split_embedding_batches(self, texts: list[str]) -> list[list[str]]:
+        batches = []
+        batch, batch_tokens = [], 0
+        for text in texts:
+            tokens = count_tokens(text, self.embedding_model_name)
+            if batch and (
+                batch_tokens + tokens > settings.EMBEDDING_BATCH_MAX_TOKENS
+                or len(batch) >= settings.EMBEDDING_BATCH_MAX_INPUTS
+            ):
+                batches.append(batch)
+                batch, batch_tokens = [], 0
+            batch.append(text)
+            batch_tokens += tokens
+
+        if batch:
+            batches.append(batch)
+        return batches
+
+    def _get_passages(self, faq: NaverFAQ) -> list[str]:
+        # prestart에서 미리 분할한 passage가 있으면 그대로 사용
+        if faq.passages:
+            return faq.passages
+        return split_passages(
+            faq.answer,
+            max_tokens=settings.PASSAGE_MAX_TOKENS,
+            overlap_tokens=settings.PASSAGE_OVERLAP_TOKENS,
+            count_tokens=lambda text: count_tokens(text, self.embedding_model_name),
+        )
+
     def _get_document_content(
-        self, faq: NaverFAQ, collection_type: CollectionType
+        self,
+        faq: NaverFAQ,
+        collection_type: CollectionType,
+        passage: str | None = None,
     ) -> str:
+        # FULL 뷰는 passage 앞에 질문을 붙여 passage 단독으로도 의미가 드러나도록 함
         if collection_type == CollectionType.FULL:
-            return f"{faq.question}\n{faq.answer}"
+            return f"{faq.question}\n{passage or faq.answer}"
         elif collection_type == CollectionType.QUESTION:
             return faq.question
         elif collection_type == CollectionType.ANSWER:
-            return faq.answer
+            return passage or faq.answer
         else:
             raise ValueError(f"Invalid collection type: {collection_type}")
 
@@ -154,6 +604,7 @@ class ChromaKnowledgeRepository(KnowledgeBaseRepository):
         self,
         collection_type: CollectionType,
         documents: list[str],
+        embeddings: list[list[float]],
         metadatas: list[dict],
         ids: list[str],
     ) -> None:
@@ -163,11 +614,13 @@ class ChromaKnowledgeRepository(KnowledgeBaseRepository):
         for i in range(0, len(documents), batch_size):
             batch_end = min(i + batch_size, len(documents))
             logger.info(
-                f"Adding batch {i // batch_size + 1} of {len(documents) // batch_size + 1} "
+                f"Upserting batch {i // batch_size + 1} of {len(documents) // batch_size + 1} "
                 f"to {collection_type.value} collection"
             )
-            collection.add(
+            await self.executor.run(
+                collection.upsert,
                 documents=documents[i:batch_end],
+                embeddings=embeddings[i:batch_end],
                 metadatas=metadatas[i:batch_end],
                 ids=ids[i:batch_end],
             )
@@ -0,0 +1,163 @@
+import math
+import pickle
+from collections import Counter
+from pathlib import Path
+
+import numpy as np
+
+from core.logging import setup_logger
+from domain.knowledge import NaverFAQ
+from utils.text import tokenize
+
+logger = setup_logger(__name__)
+
+
+class BM25Index:
+    """
+    FAQ 질문/답변/태그에 대한 BM25 역색인
+    문서별 BM25 가중치를 미리 계산해두므로 검색은 posting 가중치 합산만 수행
+    """
+
+    def __init__(
+        self,
+        faqs: list[tuple[str, str]],
+        vocabulary: dict[str, tuple[int, int, float]],
+        doc_ids: np.ndarray,
+        weights: np.ndarray,
+        corpus_version: str = "",
+        k1: float = 1.2,
+        categories: list[str] | None = None,
+        doc_categories: np.ndarray | None = None,
+    ):
+        self.faqs = faqs
+        self.vocabulary = vocabulary
+        self.doc_ids = doc_ids
+        self.weights = weights
+        self.corpus_version = corpus_version
+        self.k1 = k1
+        self.categories = categories or [""]
+        self.doc_categories = (
+            doc_categories
+            if doc_categories is not None
+            else np.zeros(len(faqs), dtype=np.int32)
+        )
+
+    @classmethod
+    def build(
+        cls,
+        faqs: list[NaverFAQ],
+        corpus_version: str = "",
+        k1: float = 1.2,
+        b: float = 0.75,
+    ) -> "BM25Index":
+        term_frequencies = []
+        for faq in faqs:
+            # 질문과 태그가 답변보다 검색 의도를 잘 드러내므로 두 번 반영
+            question_tokens = tokenize(" ".join([*faq.tags, faq.question]))
+            term_frequencies.append(Counter(question_tokens * 2 + tokenize(faq.answer)))
+
+        num_docs = len(faqs)
+        doc_lengths = np.array(
+            [sum(tf.values()) for tf in term_frequencies], dtype=np.float32
+        )
+        avg_doc_length = float(doc_lengths.mean()) if num_docs else 0.0
+
+        postings: dict[str, list[tuple[int, int]]] = {}
+        for doc_id, tf in enumerate(term_frequencies):
+            for term, count in tf.items():
+                postings.setdefault(term, []).append((doc_id, count))
+
+        vocabulary = {}
+        doc_ids = []
+        weights = []
+        for term, term_postings in postings.items():
+            df = len(term_postings)
+            idf = math.log(1 + (num_docs - df + 0.5) / (df + 0.5))
+            vocabulary[term] = (len(doc_ids), len(term_postings), idf)
+
+            for doc_id, count in term_postings:
+                norm = k1 * (1 - b + b * doc_lengths[doc_id] / avg_doc_length)
+                doc_ids.append(doc_id)
+                weights.append(idf * count * (k1 + 1) / (count + norm))
+
+        categories = sorted({"", *(faq.category for faq in faqs)})
+        category_ids = {category: i for i, category in enumerate(categories)}
+
+        return cls(
+            faqs=[(faq.question, faq.answer) for faq in faqs],
+            vocabulary=vocabulary,
+            doc_ids=np.asarray(doc_ids, dtype=np.int32),
+            weights=np.asarray(weights, dtype=np.float32),
+            corpus_version=corpus_version,
+            k1=k1,
+            categories=categories,
+            doc_categories=np.asarray(
+                [category_ids[faq.category] for faq in faqs], dtype=np.int32
+            ),
+        )
+
+    def search(
+        self, query: str, limit: int, tags: list[str] | None = None
+    ) -> list[tuple[str, str, float]]:
+        """
+        (질문, 답변, 점수) 목록 반환, 점수는 질의어가 모두 최대로 일치할 때를 1.0으로 정규화
+        tags가 주어지면 해당 카테고리와 태그 없는 FAQ만 대상으로 함
+        """
+        scores = np.zeros(len(self.faqs), dtype=np.float32)
+        max_score = 0.0
+
+        for term in set(tokenize(query)):
+            entry = self.vocabulary.get(term)
+            if entry is None:
+                continue
+            offset, length, idf = entry
+            scores[self.doc_ids[offset : offset + length]] += self.weights[
+                offset : offset + length
+            ]
+            max_score += idf * (self.k1 + 1)
+
+        if max_score == 0.0:
+            return []
+
+        if tags:
+            allowed = [i for i, c in enumerate(self.categories) if not c or c in tags]
+            scores[~np.isin(self.doc_categories, allowed)] = 0
+
+        k = min(limit, len(scores))
+        top_ids = np.argpartition(-scores, k - 1)[:k]
+        top_ids = top_ids[np.argsort(-scores[top_ids])]
+
+        return [
+            (*self.faqs[doc_id], float(scores[doc_id]) / max_score)
+            for doc_id in top_ids
+            if scores[doc_id] > 0
+        ]
+
+    def save(self, path: str) -> None:
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "wb") as f:
+            pickle.dump(
+                {
+                    "faqs": self.faqs,
+                    "vocabulary": self.vocabulary,
+                    "doc_ids": self.doc_ids,
+                    "weights": self.weights,
+                    "corpus_version": self.corpus_version,
+                    "k1": self.k1,
+                    "categories": self.categories,
+                    "doc_categories": self.doc_categories,
+                },
+                f,
+            )
+        logger.info(
+            f"Saved BM25 index ({len(self.faqs)} FAQs, {len(self.vocabulary)} terms, "
+            f"{self.doc_ids.nbytes + self.weights.nbytes} posting bytes) to {path}"
+        )
+
+    @classmethod
+    def load(cls, path: str) -> "BM25Index | None":
+        try:
+            with open(path, "rb") as f:
+                return cls(**pickle.load(f))
+        except FileNotFoundError:
+            return None
@@ -1,52 +1,181 @@
-import json
+import importlib.util
+
+from redis.exceptions import WatchError
 
 from core.config import settings
 from core.decorators import log_execution_time
 from domain.chat import Message
 from infrastructure.redis.client import RedisClient
 from interfaces.repositories.memory import ChatMemoryRepository
+from utils.codec import JsonMessageCodec, MessageCodec, MsgpackMessageCodec
 
 
 class RedisChatMemoryRepository(ChatMemoryRepository):
-    def __init__(self, message_ttl: int = None):
+    """
+    세션별 메시지를 Redis 리스트에 LPUSH로 저장 (리스트 head가 최신 메시지)
+    조회 결과는 항상 오래된 메시지부터 시간순으로 반환
+    오래된 메시지를 압축한 요약은 별도 키에 저장되며 조회 시 맨 앞의 system 메시지로 포함
+    메시지는 codec으로 인코딩된 바이트로 저장되며, 기존 JSON 항목도 그대로 읽음
+    쓰기 메서드의 publish=(channel, payload)는 같은 파이프라인에서 PUBLISH하여 추가 왕복이 없음
+    """
+
+    def __init__(self, message_ttl: int = None, codec: MessageCodec = None):
         self.message_ttl = message_ttl or settings.REDIS_MESSAGE_TTL
-        self.max_messages = 20
+        self.max_messages = settings.REDIS_MAX_MESSAGES
+        self.codec = codec or self._build_codec()
+
+    @staticmethod
+    def _build_codec() -> MessageCodec:
+        # 설정한 코덱의 패키지가 없으면 조용히 다른 포맷으로 저장하지 않고 시작 시 실패
+        codec_name = settings.CHAT_MEMORY_CODEC
+        if codec_name == "json":
+            return JsonMessageCodec()
+
+        required_packages = {
+            "msgpack": ["msgpack"],
+            "msgpack+zstd": ["msgpack", "zstandard"],
+        }[codec_name]
+        missing = [
+            package
+            for package in required_packages
+            if importlib.util.find_spec(package) is None
+        ]
+        if missing:
+            extra = "zstd" if codec_name == "msgpack+zstd" else "msgpack"
+            raise ImportError(
+                f"CHAT_MEMORY_CODEC={codec_name} requires {', '.join(missing)}; "
+                f"install it with 'poetry install -E {extra}'"
+            )
+
+        if codec_name == "msgpack":
+            return MsgpackMessageCodec(compress_min_bytes=0)
+        return MsgpackMessageCodec(
+            compress_min_bytes=settings.CHAT_MEMORY_COMPRESS_MIN_BYTES
+        )
 
     def _get_key(self, session_id: str) -> str:
         return f"chat:memory:{session_id}"
 
-    def _serialize_message(self, message: Message) -> str:
-        return json.dumps(
-            {
-                "content": message.content,
-                "role": message.role,
-            }
-        )
+    def _get_summary_key(self, session_id: str) -> str:
+        return f"chat:summary:{session_id}"
 
-    def _deserialize_message(self, message_json: str) -> Message:
-        data = json.loads(message_json)
-        return Message(
-            content=data["content"],
-            role=data["role"],
-        )
+    def _serialize_message(self, message: Message) -> bytes:
+        return self.codec.encode(message)
+
+    def _deserialize_message(self, data: bytes) -> Message:
+        return self.codec.decode(data)
 
     @log_execution_time
-    async def save_message(self, session_id: str, message: Message) -> None:
-        async with RedisClient.get_connection() as redis:
+    async def save_message(
+        self,
+        session_id: str,
+        message: Message,
+        publish: tuple[str, str] | None = None,
+    ) -> None:
+        async with RedisClient.get_binary_connection() as redis:
             key = self._get_key(session_id)
 
             async with redis.pipeline() as pipe:
                 await pipe.lpush(key, self._serialize_message(message))
                 await pipe.ltrim(key, 0, self.max_messages - 1)
                 await pipe.expire(key, self.message_ttl)
+                if publish is not None:
+                    await pipe.publish(*publish)
                 await pipe.execute()
 
+    @log_execution_time
+    async def append_turn(
+        self,
+        session_id: str,
+        messages: list[Message],
+        limit: int = 10,
+        publish: tuple[str, str] | None = None,
+    ) -> list[Message]:
+        """
+        한 턴의 메시지(시간순)를 추가하고 trim/TTL 갱신 후 최근 대화를 반환
+        MULTI/EXEC 트랜잭션 하나로 처리하므로 Redis 왕복은 1회
+        """
+        async with RedisClient.get_binary_connection() as redis:
+            key = self._get_key(session_id)
+            summary_key = self._get_summary_key(session_id)
+
+            async with redis.pipeline(transaction=True) as pipe:
+                await pipe.lpush(
+                    key, *[self._serialize_message(message) for message in messages]
+                )
+                await pipe.ltrim(key, 0, self.max_messages - 1)
+                await pipe.expire(key, self.message_ttl)
+                await pipe.expire(summary_key, self.message_ttl)
+                await pipe.lrange(key, 0, limit - 1)
+                await pipe.get(summary_key)
+                if publish is not None:
+                    await pipe.publish(*publish)
+                results = await pipe.execute()
+
+        # lpush, ltrim, expire x2 다음의 lrange/get 결과
+        messages_data, summary = results[4:6]
+        return self._to_history(messages_data, summary)
+
     @log_execution_time
     async def get_recent_messages(
         self, session_id: str, limit: int = 10
     ) -> list[Message]:
-        async with RedisClient.get_connection() as redis:
-            key = self._get_key(session_id)
-            messages_json = await redis.lrange(key, 0, limit - 1)
+        async with RedisClient.get_binary_connection() as redis:
+            async with redis.pipeline(transaction=False) as pipe:
+                await pipe.lrange(self._get_key(session_id), 0, limit - 1)
+                await pipe.get(self._get_summary_key(session_id))
+                messages_data, summary = await pipe.execute()
+
+        return self._to_history(messages_data, summary)
+
+    @log_execution_time
+    async def compact_history(
+        self,
+        session_id: str,
+        summary: str,
+        summarized_messages: list[Message],
+        publish: tuple[str, str] | None = None,
+    ) -> bool:
+        """
+        가장 오래된 메시지들(summarized_messages, 시간순)을 삭제하고 요약을 저장
+        요약하는 동안 해당 메시지가 trim되는 등 변경되었으면 아무것도 하지 않고 False 반환
+        """
+        key = self._get_key(session_id)
+        count = len(summarized_messages)
 
-            return [self._deserialize_message(msg_json) for msg_json in messages_json]
+        async with RedisClient.get_binary_connection() as redis:
+            async with redis.pipeline(transaction=True) as pipe:
+                try:
+                    await pipe.watch(key)
+                    oldest_data = await pipe.lrange(key, -count, -1)
+                    oldest = [
+                        self._deserialize_message(data)
+                        for data in reversed(oldest_data)
+                    ]
+                    if oldest != summarized_messages:
+                        return False
+
+                    pipe.multi()
+                    await pipe.set(
+                        self._get_summary_key(session_id), summary, ex=self.message_ttl
+                    )
+                    await pipe.ltrim(key, 0, -count - 1)
+                    if publish is not None:
+                        await pipe.publish(*publish)
+                    await pipe.execute()
+                except WatchError:
+                    return False
+
+        return True
+
+    def _to_history(
+        self, messages_data: list[bytes], summary: bytes | None
+    ) -> list[Message]:
+        # 리스트는 최신순으로 저장되어 있으므로 뒤집어서 시간순으로 반환
+        history = (
+            [Message(content=summary.decode("utf-8"), role="system")] if summary else []
+        )
+        history.extend(
+            self._deserialize_message(data) for data in reversed(messages_data)
+        )
+        return history
@@ -0,0 +1,193 @@
+import asyncio
+import uuid
+from contextlib import contextmanager
+from typing import Iterator
+
+from core.config import settings
+from core.logging import setup_logger
+from domain.chat import Message
+from infrastructure.redis.client import RedisClient
+from interfaces.repositories.memory import ChatMemoryRepository
+from utils.cache import TTLCache
+
+logger = setup_logger(__name__)
+
+_RESUBSCRIBE_DELAY = 1.0
+
+
+class CachedChatMemoryRepository(ChatMemoryRepository):
+    """
+    세션별 최근 대화를 워커 프로세스 내 LRU 캐시에 보관하는 write-through 래퍼
+    쓰기는 Redis에 반영한 뒤 캐시를 갱신하고, 같은 트랜잭션의 PUBLISH로 다른 워커의 캐시를 무효화
+    invalidation 채널을 구독 중일 때만 캐시를 사용하며, 구독이 끊기면 캐시를 비움
+    """
+
+    channel = "chat:memory:invalidate"
+
+    def __init__(
+        self,
+        memory_repository: ChatMemoryRepository,
+        max_size: int = None,
+        ttl: int = None,
+    ):
+        self.memory_repository = memory_repository
+        self.max_messages = settings.REDIS_MAX_MESSAGES
+        self.local_cache: TTLCache[str, list[Message]] = TTLCache(
+            max_size=max_size or settings.CHAT_HISTORY_CACHE_MAX_SIZE,
+            ttl=min(ttl or settings.CHAT_HISTORY_CACHE_TTL, settings.REDIS_MESSAGE_TTL),
+        )
+        self.worker_id = uuid.uuid4().hex
+        self._subscribed = False
+        # 조회/쓰기 도중 해당 세션이 무효화되었으면 결과를 캐시하지 않기 위한 세션별 카운터
+        # 진행 중인 요청이 있는 세션만 추적하며, 구독이 끊기면 _epoch로 전체를 무효화
+        self._epoch = 0
+        self._versions: dict[str, int] = {}
+        self._in_flight: dict[str, int] = {}
+        self._listener: asyncio.Task | None = None
+
+    async def start(self) -> None:
+        if self._listener is None:
+            self._listener = asyncio.create_task(self._listen())
+
+    async def close(self) -> None:
+        if self._listener is not None:
+            self._listener.cancel()
+            await asyncio.gather(self._listener, return_exceptions=True)
+            self._listener = None
+
+    async def save_message(
+        self,
+        session_id: str,
+        message: Message,
+        publish: tuple[str, str] | None = None,
+    ) -> None:
+        with self._track(session_id) as version:
+            await self.memory_repository.save_message(
+                session_id, message, publish=self._invalidation(session_id)
+            )
+
+            cached = self.local_cache.pop(session_id)
+            if cached is not None:
+                self._cache(
+                    session_id,
+                    self._take_recent(cached + [message], self.max_messages),
+                    version,
+                )
+            self._bump(session_id)
+
+    async def append_turn(
+        self,
+        session_id: str,
+        messages: list[Message],
+        limit: int = 10,
+        publish: tuple[str, str] | None = None,
+    ) -> list[Message]:
+        with self._track(session_id) as version:
+            history = await self.memory_repository.append_turn(
+                session_id,
+                messages,
+                limit=self.max_messages,
+                publish=self._invalidation(session_id),
+            )
+            self._cache(session_id, history, version)
+            self._bump(session_id)
+        return self._take_recent(history, limit)
+
+    async def get_recent_messages(
+        self, session_id: str, limit: int = 10
+    ) -> list[Message]:
+        if not self._subscribed:
+            return await self.memory_repository.get_recent_messages(session_id, limit)
+
+        history = self.local_cache.get(session_id)
+        if history is None:
+            with self._track(session_id) as version:
+                history = await self.memory_repository.get_recent_messages(
+                    session_id, limit=self.max_messages
+                )
+                self._cache(session_id, history, version)
+        return self._take_recent(history, limit)
+
+    async def compact_history(
+        self,
+        session_id: str,
+        summary: str,
+        summarized_messages: list[Message],
+        publish: tuple[str, str] | None = None,
+    ) -> bool:
+        with self._track(session_id):
+            compacted = await self.memory_repository.compact_history(
+                session_id,
+                summary,
+                summarized_messages,
+                publish=self._invalidation(session_id),
+            )
+            if compacted:
+                self.local_cache.pop(session_id)
+                self._bump(session_id)
+        return compacted
+
+    @contextmanager
+    def _track(self, session_id: str) -> Iterator[tuple[int, int]]:
+        """
+        요청 시작 시점의 (epoch, 세션 버전)을 반환하고, 요청이 끝나면 추적을 해제
+        """
+        self._in_flight[session_id] = self._in_flight.get(session_id, 0) + 1
+        try:
+            yield self._epoch, self._versions.get(session_id, 0)
+        finally:
+            remaining = self._in_flight.pop(session_id) - 1
+            if remaining:
+                self._in_flight[session_id] = remaining
+            else:
+                self._versions.pop(session_id, None)
+
+    def _bump(self, session_id: str) -> None:
+        # 진행 중인 다른 요청이 읽은 결과가 이 시점 이전의 것이 되도록 세션 버전을 올림
+        if session_id in self._in_flight:
+            self._versions[session_id] = self._versions.get(session_id, 0) + 1
+
+    def _cache(
+        self, session_id: str, history: list[Message], version: tuple[int, int]
+    ) -> None:
+        current = (self._epoch, self._versions.get(session_id, 0))
+        if self._subscribed and current == version:
+            self.local_cache.set(session_id, history)
+        else:
+            self.local_cache.pop(session_id)
+
+    def _take_recent(self, history: list[Message], limit: int) -> list[Message]:
+        # 요약(system 메시지)은 항상 포함하고 나머지는 최근 limit개만 반환
+        summaries = [message for message in history if message.role == "system"]
+        messages = [message for message in history if message.role != "system"]
+        return summaries + messages[max(len(messages) - limit, 0) :]
+
+    def _invalidation(self, session_id: str) -> tuple[str, str]:
+        return self.channel, f"{self.worker_id}:{session_id}"
+
+    async def _listen(self) -> None:
+        while True:
+            try:
+                async with RedisClient.get_connection() as redis:
+                    async with redis.pubsub() as pubsub:
+                        await pubsub.subscribe(self.channel)
+                        async for message in pubsub.listen():
+                            if message["type"] == "subscribe":
+                                self._subscribed = True
+                            elif message["type"] == "message":
+                                self._invalidate(message["data"])
+            except Exception as e:
+                logger.warning(f"History invalidation subscription lost: {str(e)}")
+            finally:
+                # 구독이 끊긴 동안의 무효화는 받을 수 없으므로 캐시 전체를 버림
+                self._subscribed = False
+                self._epoch += 1
+                self.local_cache.clear()
+
+            await asyncio.sleep(_RESUBSCRIBE_DELAY)
+
+    def _invalidate(self, data: str) -> None:
+        worker_id, _, session_id = data.partition(":")
+        if worker_id != self.worker_id:
+            self._bump(session_id)
+            self.local_cache.pop(session_id)
@@ -0,0 +1,222 @@
+import json
+import mmap
+import os
+import shutil
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable
+
+import numpy as np
+
+from core.enums import CollectionType
+from core.logging import setup_logger
+
+logger = setup_logger(__name__)
+
+SNAPSHOT_FORMAT_VERSION = 3
+CURRENT_FILE = "CURRENT"
+KEEP_VERSIONS = 2
+
+
+class SnapshotStrings:
+    """
+    mmap된 UTF-8 문자열 블록에서 문자열을 필요할 때만 디코딩
+    """
+
+    def __init__(self, data: mmap.mmap, offsets: np.ndarray):
+        self.data = data
+        self.offsets = offsets
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, index: int) -> str:
+        start, end = int(self.offsets[index]), int(self.offsets[index + 1])
+        return self.data[start:end].decode("utf-8")
+
+    def __iter__(self):
+        return (self[index] for index in range(len(self)))
+
+
+class SnapshotFAQs:
+    """
+    질문, 답변 순으로 저장된 문자열을 (질문, 답변) 쌍으로 접근
+    """
+
+    def __init__(self, strings: SnapshotStrings):
+        self.strings = strings
+
+    def __len__(self) -> int:
+        return len(self.strings) // 2
+
+    def __getitem__(self, faq_id: int) -> tuple[str, str]:
+        return self.strings[2 * faq_id], self.strings[2 * faq_id + 1]
+
+    def __iter__(self):
+        return (self[faq_id] for faq_id in range(len(self)))
+
+
+@dataclass
+class FAQSnapshot:
+    manifest: dict
+    faqs: SnapshotFAQs
+    matrix: np.ndarray
+    squared_norms: np.ndarray
+    row_faq_ids: np.ndarray
+    row_passages: SnapshotStrings
+    row_passage_indices: np.ndarray
+    view_ranges: dict[CollectionType, tuple[int, int]]
+    categories: list[str]
+    faq_categories: np.ndarray
+
+
+def write_snapshot(
+    directory: str,
+    faqs: list[tuple[str, str]],
+    matrix: np.ndarray,
+    row_faq_ids: np.ndarray,
+    row_passages: list[str],
+    row_passage_indices: np.ndarray,
+    view_ranges: dict[CollectionType, tuple[int, int]],
+    categories: list[str],
+    faq_categories: np.ndarray,
+    embedding_model: str,
+    content_hash: str,
+) -> Path:
+    """
+    임베딩 행렬, 문자열 오프셋, manifest를 버전별 디렉토리에 기록하고 CURRENT 포인터를 교체
+    이미 실행 중인 워커가 mmap한 이전 버전 파일은 수정하지 않음
+    """
+    root = Path(directory)
+    version = f"v{SNAPSHOT_FORMAT_VERSION}-{content_hash[:16]}"
+    target = root / version
+    staging = root / f".{version}.tmp"
+
+    current = root / CURRENT_FILE
+    if target.exists() and current.exists() and current.read_text() == version:
+        logger.info(f"FAQ snapshot {version} is already up to date")
+        return target
+
+    shutil.rmtree(staging, ignore_errors=True)
+    staging.mkdir(parents=True)
+
+    matrix = np.ascontiguousarray(matrix, dtype=np.float32)
+    np.save(staging / "embeddings.npy", matrix)
+    np.save(staging / "squared_norms.npy", np.einsum("ij,ij->i", matrix, matrix))
+    np.save(staging / "row_faq_ids.npy", np.asarray(row_faq_ids, dtype=np.int32))
+    np.save(
+        staging / "row_passage_indices.npy",
+        np.asarray(row_passage_indices, dtype=np.int32),
+    )
+    np.save(staging / "faq_categories.npy", np.asarray(faq_categories, dtype=np.int32))
+
+    _write_strings(
+        staging,
+        "strings",
+        (text for question, answer in faqs for text in (question, answer)),
+    )
+    _write_strings(staging, "passages", row_passages)
+
+    manifest = {
+        "format_version": SNAPSHOT_FORMAT_VERSION,
+        "embedding_model": embedding_model,
+        "content_hash": content_hash,
+        "num_faqs": len(faqs),
+        "num_vectors": int(matrix.shape[0]),
+        "dimension": int(matrix.shape[1]) if matrix.ndim == 2 else 0,
+        "views": {
+            collection_type.value: list(view_range)
+            for collection_type, view_range in view_ranges.items()
+        },
+        "categories": categories,
+    }
+    with open(staging / "manifest.json", "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+
+    shutil.rmtree(target, ignore_errors=True)
+    os.replace(staging, target)
+
+    current_tmp = root / f".{CURRENT_FILE}.tmp"
+    current_tmp.write_text(version)
+    os.replace(current_tmp, current)
+
+    _prune_old_versions(root, keep=version)
+    logger.info(f"Wrote FAQ snapshot {version} ({len(faqs)} FAQs) to {root}")
+    return target
+
+
+def _write_strings(directory: Path, name: str, texts: Iterable[str]) -> None:
+    offsets = [0]
+    with open(directory / f"{name}.bin", "wb") as f:
+        for text in texts:
+            encoded = text.encode("utf-8")
+            f.write(encoded)
+            offsets.append(offsets[-1] + len(encoded))
+    np.save(directory / f"{name}_offsets.npy", np.asarray(offsets, dtype=np.int64))
+
+
+def _load_strings(directory: Path, name: str) -> SnapshotStrings:
+    with open(directory / f"{name}.bin", "rb") as f:
+        # 빈 파일은 mmap할 수 없음
+        data = (
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            if os.fstat(f.fileno()).st_size
+            else b""
+        )
+    return SnapshotStrings(
+        data, np.load(directory / f"{name}_offsets.npy", mmap_mode="r")
+    )
+
+
+def _prune_old_versions(root: Path, keep: str) -> None:
+    versions = sorted(
+        (path for path in root.glob("v*") if path.is_dir() and path.name != keep),
+        key=lambda path: path.stat().st_mtime,
+        reverse=True,
+    )
+    for path in versions[KEEP_VERSIONS - 1 :]:
+        shutil.rmtree(path, ignore_errors=True)
+
+
+def load_snapshot(directory: str) -> FAQSnapshot | None:
+    """
+    CURRENT가 가리키는 스냅샷을 읽기 전용 mmap으로 로드, 없으면 None 반환
+    여러 워커가 같은 페이지 캐시를 공유하므로 워커별 힙 복사본이 생기지 않음
+    """
+    root = Path(directory)
+    try:
+        version = (root / CURRENT_FILE).read_text().strip()
+    except FileNotFoundError:
+        return None
+
+    # 포인터가 가리키는 버전이 없거나 손상된 경우 Chroma 로드로 대체되도록 None 반환
+    try:
+        return _load_version(root / version)
+    except (OSError, ValueError, KeyError) as e:
+        logger.warning(f"Failed to load FAQ snapshot {version}: {str(e)}")
+        return None
+
+
+def _load_version(path: Path) -> FAQSnapshot | None:
+    with open(path / "manifest.json", encoding="utf-8") as f:
+        manifest = json.load(f)
+
+    if manifest.get("format_version") != SNAPSHOT_FORMAT_VERSION:
+        logger.warning(f"Unsupported FAQ snapshot format: {manifest}")
+        return None
+
+    return FAQSnapshot(
+        manifest=manifest,
+        faqs=SnapshotFAQs(_load_strings(path, "strings")),
+        matrix=np.load(path / "embeddings.npy", mmap_mode="r"),
+        squared_norms=np.load(path / "squared_norms.npy", mmap_mode="r"),
+        row_faq_ids=np.load(path / "row_faq_ids.npy", mmap_mode="r"),
+        row_passages=_load_strings(path, "passages"),
+        row_passage_indices=np.load(path / "row_passage_indices.npy", mmap_mode="r"),
+        view_ranges={
+            CollectionType(view): tuple(view_range)
+            for view, view_range in manifest["views"].items()
+        },
+        categories=manifest["categories"],
+        faq_categories=np.load(path / "faq_categories.npy", mmap_mode="r"),
+    )
@@ -0,0 +1,122 @@
+from pathlib import Path
+
+import numpy as np
+
+from core.logging import setup_logger
+
+logger = setup_logger(__name__)
+
+
+class TagRouter:
+    """
+    FAQ 카테고리(첫 번째 태그)별 평균 임베딩(centroid)으로 질의가 속할 카테고리를 예측
+    예측 비용은 카테고리 수 x 임베딩 차원의 행렬-벡터 곱 한 번
+    """
+
+    def __init__(
+        self,
+        tags: list[str],
+        centroids: np.ndarray,
+        corpus_version: str = "",
+        embedding_model: str = "",
+    ):
+        self.tags = tags
+        self.centroids = centroids
+        self.corpus_version = corpus_version
+        self.embedding_model = embedding_model
+
+    @classmethod
+    def build(
+        cls,
+        row_tags: list[str],
+        embeddings: np.ndarray,
+        corpus_version: str = "",
+        embedding_model: str = "",
+    ) -> "TagRouter":
+        """
+        FULL 컬렉션의 (카테고리, 임베딩) 행으로부터 정규화된 카테고리 centroid 계산
+        태그가 없는 FAQ는 항상 검색 대상이므로 centroid를 만들지 않음
+        """
+        tags = sorted({tag for tag in row_tags if tag})
+        tag_ids = {tag: i for i, tag in enumerate(tags)}
+        embeddings = np.asarray(embeddings, dtype=np.float32)
+        dimension = embeddings.shape[1] if embeddings.ndim == 2 else 0
+
+        centroids = np.zeros((len(tags), dimension), dtype=np.float32)
+        counts = np.zeros(len(tags), dtype=np.float32)
+        for tag, embedding in zip(row_tags, embeddings):
+            if tag:
+                centroids[tag_ids[tag]] += embedding
+                counts[tag_ids[tag]] += 1
+
+        centroids /= np.maximum(counts, 1)[:, None]
+        centroids /= np.maximum(np.linalg.norm(centroids, axis=1), 1e-12)[:, None]
+
+        return cls(
+            tags=tags,
+            centroids=centroids,
+            corpus_version=corpus_version,
+            embedding_model=embedding_model,
+        )
+
+    def predict(
+        self,
+        query_embedding: list[float],
+        history_embeddings: list[list[float]] | None = None,
+        history_weight: float = 0.5,
+        max_tags: int = 2,
+        min_similarity: float = 0.3,
+        margin: float = 0.05,
+    ) -> list[str] | None:
+        """
+        질의(및 최근 대화) 임베딩과 가장 가까운 카테고리 목록 반환
+        최상위 유사도가 낮으면 판단을 보류하고 None 반환 (전체 검색)
+        """
+        if not self.tags:
+            return None
+
+        vector = self._normalize(np.asarray(query_embedding, dtype=np.float32))
+        if history_embeddings:
+            history = np.asarray(history_embeddings, dtype=np.float32)
+            vector = self._normalize(
+                vector + history_weight * self._normalize(history.mean(axis=0))
+            )
+
+        similarities = self.centroids @ vector
+        ranked = np.argsort(-similarities)[:max_tags]
+        top_similarity = float(similarities[ranked[0]])
+        if top_similarity < min_similarity:
+            return None
+
+        return [
+            self.tags[i] for i in ranked if similarities[i] >= top_similarity - margin
+        ]
+
+    @staticmethod
+    def _normalize(vector: np.ndarray) -> np.ndarray:
+        return vector / max(float(np.linalg.norm(vector)), 1e-12)
+
+    def save(self, path: str) -> None:
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "wb") as f:
+            np.savez(
+                f,
+                tags=np.asarray(self.tags, dtype=str),
+                centroids=self.centroids,
+                corpus_version=self.corpus_version,
+                embedding_model=self.embedding_model,
+            )
+        logger.info(f"Saved {len(self.tags)} FAQ category centroids to {path}")
+
+    @classmethod
+    def load(cls, path: str) -> "TagRouter | None":
+        try:
+            with np.load(path) as data:
+                return cls(
+                    tags=[str(tag) for tag in data["tags"]],
+                    centroids=data["centroids"],
+                    corpus_version=str(data["corpus_version"]),
+                    embedding_model=str(data["embedding_model"]),
+                )
+        except FileNotFoundError:
+            return None
@@ -0,0 +1,337 @@
+import copy
+from typing import Iterable, Sequence
+
+import numpy as np
+
+from core.config import settings
+from core.decorators import log_execution_time
+from core.enums import CollectionType
+from core.logging import setup_logger
+from domain.knowledge import IngestionReport, NaverFAQ, SearchResult
+from interfaces.repositories.embedding import EmbeddingCacheRepository
+from repositories.knowledge import ChromaKnowledgeRepository
+from repositories.snapshot import load_snapshot, write_snapshot
+
+logger = setup_logger(__name__)
+
+# 코퍼스 버전이 바뀌었을 때 사본에서 다시 적재한 뒤 교체하는 검색 색인 속성
+_INDEX_ATTRIBUTES = (
+    "faqs",
+    "matrix",
+    "squared_norms",
+    "row_faq_ids",
+    "row_passages",
+    "row_passage_indices",
+    "view_ranges",
+    "categories",
+    "faq_categories",
+    "partitions",
+    "lexical_index",
+    "tag_router",
+    "index_version",
+)
+
+
+class InMemoryKnowledgeRepository(ChromaKnowledgeRepository):
+    """
+    FULL/QUESTION/ANSWER 임베딩 전체를 하나의 float32 행렬로 메모리에 올려
+    단일 행렬곱으로 세 뷰를 동시에 정확(brute-force) 검색하는 지식 저장소
+    적재(bulk_add_faqs)는 ChromaDB를 그대로 사용하고, 검색 시에는 I/O가 없음
+    다른 프로세스(prestart)가 FAQ를 재동기화하면 get_corpus_version이 이를 감지해 색인을 다시 적재
+    """
+
+    def __init__(
+        self,
+        embedding_cache: EmbeddingCacheRepository | None = None,
+        snapshot_directory: str = None,
+    ):
+        super().__init__(embedding_cache=embedding_cache)
+        self.snapshot_directory = snapshot_directory or settings.FAQ_SNAPSHOT_DIRECTORY
+        self.faqs: Sequence[tuple[str, str]] = []
+        self.matrix = np.empty((0, 0), dtype=np.float32)
+        self.squared_norms = np.empty(0, dtype=np.float32)
+        self.row_faq_ids = np.empty(0, dtype=np.int32)
+        self.row_passages: Sequence[str] = []
+        self.row_passage_indices = np.empty(0, dtype=np.int32)
+        self.view_ranges: dict[CollectionType, tuple[int, int]] = {}
+        self.categories: list[str] = [""]
+        self.faq_categories = np.empty(0, dtype=np.int32)
+        self.partitions: dict[CollectionType, list[np.ndarray]] = {}
+        if not self._load_snapshot():
+            self._load_index()
+        self._build_partitions()
+        # 현재 색인이 적재된 코퍼스 버전 / 마지막으로 다시 적재를 시도한 버전
+        self.index_version = self.corpus_version
+        self._reload_version = self.corpus_version
+
+    @log_execution_time
+    def _load_snapshot(self) -> bool:
+        """
+        prestart가 생성한 mmap 스냅샷이 현재 컬렉션과 일치하면 이를 사용
+        """
+        snapshot = load_snapshot(self.snapshot_directory)
+        if snapshot is None:
+            return False
+
+        manifest = snapshot.manifest
+        if manifest["embedding_model"] != self.embedding_model_name or (
+            manifest["content_hash"] != self.corpus_version
+        ):
+            logger.warning(
+                "FAQ snapshot does not match the current collections, "
+                "loading embeddings from ChromaDB instead"
+            )
+            return False
+
+        self.faqs = snapshot.faqs
+        self.matrix = snapshot.matrix
+        self.squared_norms = snapshot.squared_norms
+        self.row_faq_ids = snapshot.row_faq_ids
+        self.row_passages = snapshot.row_passages
+        self.row_passage_indices = snapshot.row_passage_indices
+        self.view_ranges = snapshot.view_ranges
+        self.categories = snapshot.categories
+        self.faq_categories = snapshot.faq_categories
+
+        logger.info(
+            f"Mapped FAQ snapshot ({manifest['num_faqs']} FAQs, "
+            f"{manifest['num_vectors']} vectors) from {self.snapshot_directory}"
+        )
+        return True
+
+    async def get_corpus_version(self) -> str:
+        corpus_version = await super().get_corpus_version()
+        # 실패한 버전은 다음 버전 변경 전까지 다시 시도하지 않음 (동시 요청의 중복 적재도 방지)
+        if corpus_version in (self.index_version, self._reload_version):
+            return corpus_version
+
+        self._reload_version = corpus_version
+        try:
+            index = await self.executor.run(self._load_index_copy)
+        except Exception as e:
+            logger.warning(f"Failed to reload in-memory index: {str(e)}")
+            return corpus_version
+
+        # 검색 중인 요청이 일부만 교체된 색인을 보지 않도록 await 없이 한 번에 교체
+        for name in _INDEX_ATTRIBUTES:
+            setattr(self, name, getattr(index, name))
+        logger.info(f"Reloaded in-memory index for corpus version {corpus_version}")
+        return corpus_version
+
+    def _load_index_copy(self) -> "InMemoryKnowledgeRepository":
+        index = copy.copy(self)
+        if not index._load_snapshot():
+            index._load_index()
+        index._build_partitions()
+        if settings.HYBRID_SEARCH_ENABLED:
+            index.lexical_index = index._load_lexical_index()
+        if settings.TAG_ROUTING_ENABLED:
+            index.tag_router = index._load_tag_router()
+        index.index_version = index.corpus_version
+        return index
+
+    def save_snapshot(self) -> None:
+        write_snapshot(
+            directory=self.snapshot_directory,
+            faqs=list(self.faqs),
+            matrix=self.matrix,
+            row_faq_ids=self.row_faq_ids,
+            row_passages=list(self.row_passages),
+            row_passage_indices=self.row_passage_indices,
+            view_ranges=self.view_ranges,
+            categories=self.categories,
+            faq_categories=self.faq_categories,
+            embedding_model=self.embedding_model_name,
+            content_hash=self.corpus_version,
+        )
+
+    @log_execution_time
+    def _load_index(self) -> None:
+        faq_ids: dict[tuple[str, str], int] = {}
+        faqs: list[tuple[str, str]] = []
+        faq_categories: list[str] = []
+        view_embeddings = []
+        row_faq_ids = []
+        # QUESTION 뷰 행은 passage가 없으므로 빈 문자열 / -1
+        row_passages = []
+        row_passage_indices = []
+        view_ranges = {}
+        offset = 0
+
+        for collection_type in CollectionType:
+            records = self.collections[collection_type].get(
+                include=["embeddings", "metadatas"]
+            )
+            embeddings = records["embeddings"]
+            count = len(records["ids"])
+
+            for metadata in records["metadatas"]:
+                key = (metadata["question"], metadata["answer"])
+                if key not in faq_ids:
+                    faq_ids[key] = len(faqs)
+                    faqs.append(key)
+                    faq_categories.append(self._get_category(metadata))
+                row_faq_ids.append(faq_ids[key])
+                row_passages.append(metadata.get("passage", ""))
+                row_passage_indices.append(metadata.get("passage_index", -1))
+
+            if count:
+                view_embeddings.append(np.asarray(embeddings, dtype=np.float32))
+            view_ranges[collection_type] = (offset, offset + count)
+            offset += count
+
+        self.faqs = faqs
+        self.view_ranges = view_ranges
+        self.categories = sorted({"", *faq_categories})
+        category_ids = {category: i for i, category in enumerate(self.categories)}
+        self.faq_categories = np.asarray(
+            [category_ids[category] for category in faq_categories], dtype=np.int32
+        )
+        self.row_faq_ids = np.asarray(row_faq_ids, dtype=np.int32)
+        self.row_passages = row_passages
+        self.row_passage_indices = np.asarray(row_passage_indices, dtype=np.int32)
+        self.matrix = (
+            np.ascontiguousarray(np.vstack(view_embeddings))
+            if view_embeddings
+            else np.empty((0, 0), dtype=np.float32)
+        )
+        self.squared_norms = np.einsum("ij,ij->i", self.matrix, self.matrix)
+
+        logger.info(
+            f"Loaded {len(self.faqs)} FAQs ({self.matrix.shape[0]} vectors, "
+            f"{self.matrix.nbytes / 1024 / 1024:.1f}MB) into in-memory index"
+        )
+
+    def _build_partitions(self) -> None:
+        """
+        뷰별로 카테고리에 속한 행 번호를 미리 모아 카테고리 필터 검색 시 해당 행만 계산
+        """
+        row_categories = np.asarray(self.faq_categories)[self.row_faq_ids]
+        self.partitions = {}
+        for collection_type, (start, end) in self.view_ranges.items():
+            view_categories = row_categories[start:end]
+            self.partitions[collection_type] = [
+                np.flatnonzero(view_categories == category_id) + start
+                for category_id in range(len(self.categories))
+            ]
+
+    @log_execution_time
+    async def find_similar(
+        self,
+        query: str,
+        limit: int = 3,
+        distance_threshold: float = 1.0,
+        query_embedding: list[float] | None = None,
+        tags: list[str] | None = None,
+    ) -> list[dict]:
+        if query_embedding is None:
+            query_embedding = await self.embed_query(query)
+
+        if not self.matrix.size:
+            return []
+
+        results = self._search_index(query_embedding, limit, distance_threshold, tags)
+        weighted_results = self._combine_results(
+            results, self._search_lexical(query, limit, tags)
+        )
+
+        return weighted_results[:limit]
+
+    def _search_index(
+        self,
+        query_embedding: list[float],
+        limit: int,
+        threshold: float,
+        tags: list[str] | None = None,
+    ) -> list[list[SearchResult]]:
+        query_vector = np.asarray(query_embedding, dtype=np.float32)
+
+        # (뷰, 거리 배열 내 구간, 구간의 실제 행 번호) - 전체 검색 시 행 번호는 연속 구간
+        if tags:
+            allowed = [
+                category_id
+                for category_id, category in enumerate(self.categories)
+                if not category or category in tags
+            ]
+            view_rows = {
+                collection_type: np.concatenate(
+                    [partitions[category_id] for category_id in allowed]
+                )
+                for collection_type, partitions in self.partitions.items()
+            }
+            rows = np.concatenate(list(view_rows.values()))
+            segments, offset = [], 0
+            for collection_type, row_ids in view_rows.items():
+                segments.append(
+                    (collection_type, offset, offset + len(row_ids), row_ids)
+                )
+                offset += len(row_ids)
+        else:
+            rows = slice(None)
+            segments = [
+                (collection_type, start, end, None)
+                for collection_type, (start, end) in self.view_ranges.items()
+            ]
+
+        # ChromaDB 기본(l2) 거리와 동일한 제곱 유클리드 거리를 한 번의 행렬곱으로 계산
+        distances = (
+            self.squared_norms[rows]
+            - 2 * (self.matrix[rows] @ query_vector)
+            + np.dot(query_vector, query_vector)
+        )
+
+        results = []
+        for collection_type, start, end, row_ids in segments:
+            view_distances = distances[start:end]
+            view_limit = (
+                limit
+                if collection_type == CollectionType.QUESTION
+                else limit * settings.PASSAGE_SEARCH_MULTIPLIER
+            )
+            k = min(view_limit, end - start)
+            if k == 0:
+                results.append([])
+                continue
+
+            top_rows = np.argpartition(view_distances, k - 1)[:k]
+            top_rows = top_rows[np.argsort(view_distances[top_rows])]
+
+            search_results = []
+            for row in top_rows:
+                distance = float(view_distances[row])
+                if distance > threshold:
+                    continue
+
+                row_id = start + row if row_ids is None else row_ids[row]
+                question, answer = self.faqs[self.row_faq_ids[row_id]]
+                passage_index = int(self.row_passage_indices[row_id])
+                search_results.append(
+                    SearchResult(
+                        question=question,
+                        answer=answer,
+                        score=1 - distance,
+                        collection_type=collection_type,
+                        passage=(
+                            self.row_passages[row_id] if passage_index >= 0 else None
+                        ),
+                        passage_index=passage_index if passage_index >= 0 else None,
+                    )
+                )
+            results.append(search_results)
+
+        return results
+
+    @log_execution_time
+    async def bulk_add_faqs(self, faqs: list[NaverFAQ]) -> None:
+        await super().bulk_add_faqs(faqs)
+        self._load_index()
+        self._build_partitions()
+        self.index_version = self.corpus_version
+
+    @log_execution_time
+    async def sync_faqs(self, faqs: Iterable[NaverFAQ]) -> IngestionReport:
+        report = await super().sync_faqs(faqs)
+        self._load_index()
+        self._build_partitions()
+        self.index_version = self.corpus_version
+        return report
@@ -1,19 +1,28 @@
+import asyncio
 from typing import AsyncGenerator
 
+from core.config import settings
 from core.constants import WELCOME_MESSAGE, NO_SMARTSTORE_MESSAGE, UNRECOGNIZED_MESSAGE
 from core.decorators import log_execution_time
 from core.logging import setup_logger
 from core.prompts import prompts
+from domain.cache import CachedAnswer
 from domain.chat import Message, ChatResponse
+from domain.prompt import ContextBudget, PromptContext
+from interfaces.repositories.answer_cache import AnswerCacheRepository
 from interfaces.repositories.knowledge import KnowledgeBaseRepository
 from interfaces.repositories.memory import ChatMemoryRepository
 from interfaces.services.chat import ChatService
 from interfaces.services.llm import LLMService
+from interfaces.services.reranker import RerankerService
+from interfaces.services.summary import ChatSummaryService
 from interfaces.services.validator import QuestionValidatorService
-from utils.format import format_knowledge_context, format_chat_history
+from utils.context import build_prompt_context
 
 logger = setup_logger(__name__)
 
+_STREAM_END = object()
+
 
 class SmartStoreChatService(ChatService):
     def __init__(
@@ -22,22 +31,49 @@ class SmartStoreChatService(ChatService):
         memory_repository: ChatMemoryRepository,
         knowledge_repository: KnowledgeBaseRepository,
         validator_service: QuestionValidatorService,
+        answer_cache: AnswerCacheRepository | None = None,
+        speculative_answer: bool = None,
+        follow_up_mode: str = None,
+        reranker: RerankerService | None = None,
+        summary_service: ChatSummaryService | None = None,
     ):
         self.llm_service = llm_service
         self.validator_service = validator_service
         self.memory_repository = memory_repository
         self.knowledge_repository = knowledge_repository
+        self.answer_cache = answer_cache
+        self.reranker = reranker
+        self.summary_service = summary_service
+        self.speculative_answer = (
+            settings.CHAT_SPECULATIVE_ANSWER
+            if speculative_answer is None
+            else speculative_answer
+        )
+        self.follow_up_mode = follow_up_mode or settings.CHAT_FOLLOW_UP_MODE
+        self.follow_up_partial_answer_chars = (
+            settings.CHAT_FOLLOW_UP_PARTIAL_ANSWER_CHARS
+        )
+        self.tag_routing = settings.TAG_ROUTING_ENABLED
+        self.answer_budget = ContextBudget(
+            context_tokens=settings.ANSWER_CONTEXT_TOKENS,
+            history_tokens=settings.ANSWER_HISTORY_TOKENS,
+            max_answer_tokens=settings.CONTEXT_MAX_ANSWER_TOKENS,
+        )
+        self.follow_up_budget = ContextBudget(
+            context_tokens=settings.FOLLOW_UP_CONTEXT_TOKENS,
+            history_tokens=settings.FOLLOW_UP_HISTORY_TOKENS,
+            max_answer_tokens=settings.CONTEXT_MAX_ANSWER_TOKENS,
+        )
 
     async def create_chat_completion(
         self,
         query: str,
-        chat_history: list[Message],
-        knowledge_context: str,
+        prompt_context: PromptContext,
     ) -> AsyncGenerator[str, None]:
         messages = prompts.PT_FAQ_QUESTION.format(
             query=query,
-            chat_history=format_chat_history(chat_history),
-            context=knowledge_context,
+            chat_history=prompt_context.chat_history,
+            context=prompt_context.knowledge_context,
         )
 
         async for chunk in await self.llm_service.generate_completion(
@@ -49,63 +85,254 @@ class SmartStoreChatService(ChatService):
     async def generate_chat_response(
         self, session_id: str, message: str
     ) -> AsyncGenerator[ChatResponse, None]:
-        # 이전 대화 내역 조회
+        # 이전 대화 내역 조회 (시간순)
         chat_history = await self.memory_repository.get_recent_messages(
             session_id, limit=10
         )
 
+        # 코퍼스가 재동기화되었으면 검색 전에 반영 (in-memory 색인 재적재 포함)
+        corpus_version = await self.knowledge_repository.get_corpus_version()
+
         # 관련 FAQ 검색
-        similar_faqs = await self.knowledge_repository.find_similar(message, limit=5)
+        query_embedding = await self.knowledge_repository.embed_query(message)
+        similar_faqs = await self.find_similar_faqs(
+            message, query_embedding, chat_history
+        )
+
+        # 같은 FAQ 집합에 대한 유사 질문의 답변이 캐시되어 있으면 그대로 재생
+        # 이전 대화가 있으면 답변이 맥락에 따라 달라지므로 캐시를 사용하지 않음
+        use_answer_cache = self.answer_cache is not None and not any(
+            message.role in ("user", "assistant") for message in chat_history
+        )
+        if use_answer_cache and similar_faqs:
+            cached_answer = await self.answer_cache.find(
+                query_embedding, similar_faqs, corpus_version
+            )
+            if cached_answer is not None:
+                async for response in self._replay_cached_answer(
+                    session_id, message, cached_answer
+                ):
+                    yield response
+                return
 
-        is_related = await self.is_smartstore_related_question(
-            message, chat_history, similar_faqs
+        answer_context = self.build_prompt_context(
+            "answer", message, similar_faqs, chat_history, self.answer_budget
         )
 
-        # 스마트스토어와 관련없는 질문인 경우
-        if not is_related:
-            yield ChatResponse(message=NO_SMARTSTORE_MESSAGE)
-            # 스마트스토어와 관련없는 질문이더라도 후속 질문은 생성
-            yield await self.get_follow_up_message(
+        # 추론 모드: 검증과 동시에 답변 생성을 시작하고 판정 전까지 토큰을 버퍼링
+        answer_queue: asyncio.Queue | None = None
+        speculative_task: asyncio.Task | None = None
+        follow_up_task: asyncio.Task | None = None
+        if self.speculative_answer and similar_faqs:
+            answer_queue = asyncio.Queue()
+            speculative_task = asyncio.create_task(
+                self._buffer_chat_completion(
+                    answer_queue, query=message, prompt_context=answer_context
+                )
+            )
+
+        try:
+            is_related = await self.is_smartstore_related_question(
+                message, chat_history, similar_faqs
+            )
+
+            # 스마트스토어와 관련없는 질문인 경우
+            if not is_related:
+                if speculative_task is not None:
+                    speculative_task.cancel()
+                yield ChatResponse(message=NO_SMARTSTORE_MESSAGE)
+                # 스마트스토어와 관련없는 질문이더라도 후속 질문은 생성
+                yield await self.get_follow_up_message(
+                    query=message,
+                    answer="",
+                    chat_history=chat_history,
+                    similar_faqs=similar_faqs[:3],
+                )
+                return
+
+            # 유사한 FAQ가 없는 경우
+            if not similar_faqs:
+                yield ChatResponse(message=UNRECOGNIZED_MESSAGE)
+                return
+
+            # 답변 생성 및 스트리밍
+            if answer_queue is not None:
+                logger.debug(
+                    f"Flushing {answer_queue.qsize()} speculatively buffered chunks"
+                )
+                answer_stream = self._drain_buffered_completion(answer_queue)
+            else:
+                answer_stream = self.create_chat_completion(
+                    query=message, prompt_context=answer_context
+                )
+
+            # 후속 질문 생성을 답변 스트리밍과 겹쳐서 시작 (follow_up_mode 설정)
+            if self.follow_up_mode == "from_context":
+                follow_up_task = self._start_follow_up_task(
+                    message, "", chat_history, similar_faqs
+                )
+
+            answer_chunks = []
+            answer_length = 0
+            async for chunk in answer_stream:
+                answer_chunks.append(chunk)
+                answer_length += len(chunk)
+                yield ChatResponse(message=chunk)
+
+                if (
+                    self.follow_up_mode == "from_partial_answer"
+                    and follow_up_task is None
+                    and answer_length >= self.follow_up_partial_answer_chars
+                ):
+                    follow_up_task = self._start_follow_up_task(
+                        message, "".join(answer_chunks), chat_history, similar_faqs
+                    )
+
+            complete_answer = "".join(answer_chunks)
+            if follow_up_task is None:
+                follow_up_task = self._start_follow_up_task(
+                    message, complete_answer, chat_history, similar_faqs
+                )
+
+            # 사용자 메시지와 완성된 답변을 한 번에 저장 (후속 질문 생성과 동시 진행)
+            await self.save_turn(session_id, message, complete_answer)
+            follow_up_message = await follow_up_task
+        finally:
+            for task in (speculative_task, follow_up_task):
+                if task is not None and not task.done():
+                    task.cancel()
+
+        if use_answer_cache:
+            await self.answer_cache.save(
                 query=message,
-                answer="",
+                query_embedding=query_embedding,
+                similar_faqs=similar_faqs,
+                corpus_version=corpus_version,
+                answer=complete_answer,
+                follow_ups=follow_up_message.follow_ups or [],
+            )
+
+        yield follow_up_message
+
+    @log_execution_time
+    async def find_similar_faqs(
+        self, query: str, query_embedding: list[float], chat_history: list[Message]
+    ) -> list[dict]:
+        tags = None
+        if self.tag_routing:
+            # 최근 사용자 메시지의 임베딩은 이전 턴에서 계산되어 보통 캐시에 있음
+            # 라우팅은 best-effort이므로 캐시에 없는 메시지는 임베딩을 새로 계산하지 않고 제외
+            history_queries = [
+                message.content
+                for message in reversed(chat_history)
+                if message.role == "user"
+            ][: settings.TAG_ROUTING_HISTORY_MESSAGES]
+            cached_embeddings = await asyncio.gather(
+                *[
+                    self.knowledge_repository.get_cached_query_embedding(history_query)
+                    for history_query in history_queries
+                ]
+            )
+            history_embeddings = [
+                embedding for embedding in cached_embeddings if embedding is not None
+            ]
+            tags = await self.knowledge_repository.predict_tags(
+                query_embedding, history_embeddings
+            )
+
+        # 재정렬 시에는 더 많은 후보를 가져온 뒤 상위 5개만 사용
+        limit = 5
+        candidate_limit = (
+            max(limit, settings.RERANK_CANDIDATES) if self.reranker else limit
+        )
+
+        similar_faqs = await self.knowledge_repository.find_similar(
+            query, limit=candidate_limit, query_embedding=query_embedding, tags=tags
+        )
+
+        # 예측한 카테고리에서 찾지 못한 경우 전체 범위로 다시 검색
+        if tags and not similar_faqs:
+            logger.debug(f"No FAQs found in categories {tags}, searching all")
+            similar_faqs = await self.knowledge_repository.find_similar(
+                query, limit=candidate_limit, query_embedding=query_embedding
+            )
+
+        if self.reranker is not None and similar_faqs:
+            similar_faqs = await self.reranker.rerank(query, similar_faqs, limit)
+        return similar_faqs
+
+    @staticmethod
+    def build_prompt_context(
+        prompt_name: str,
+        query: str,
+        similar_faqs: list[dict],
+        chat_history: list[Message],
+        budget: ContextBudget,
+    ) -> PromptContext:
+        prompt_context = build_prompt_context(
+            query, similar_faqs, chat_history, budget, settings.OPENAI_CHAT_MODEL
+        )
+        logger.debug(f"{prompt_name} prompt tokens: {prompt_context.token_usage}")
+        return prompt_context
+
+    def _start_follow_up_task(
+        self,
+        query: str,
+        answer: str,
+        chat_history: list[Message],
+        similar_faqs: list[dict],
+    ) -> asyncio.Task:
+        return asyncio.create_task(
+            self.get_follow_up_message(
+                query=query,
+                answer=answer,
                 chat_history=chat_history,
-                similar_faqs=similar_faqs[:3],
+                similar_faqs=similar_faqs,
             )
-            return
+        )
 
-        # 유사한 FAQ가 없는 경우
-        if not similar_faqs:
-            yield ChatResponse(message=UNRECOGNIZED_MESSAGE)
-            return
+    async def _buffer_chat_completion(
+        self, queue: asyncio.Queue, query: str, prompt_context: PromptContext
+    ) -> None:
+        try:
+            async for chunk in self.create_chat_completion(
+                query=query, prompt_context=prompt_context
+            ):
+                await queue.put(chunk)
+        except Exception as e:
+            await queue.put(e)
+        await queue.put(_STREAM_END)
 
-        # 사용자 메시지 저장
-        user_message = Message(content=message, role="user")
-        await self.memory_repository.save_message(session_id, user_message)
+    @staticmethod
+    async def _drain_buffered_completion(
+        queue: asyncio.Queue,
+    ) -> AsyncGenerator[str, None]:
+        while (chunk := await queue.get()) is not _STREAM_END:
+            if isinstance(chunk, Exception):
+                raise chunk
+            yield chunk
 
-        # 답변 생성 및 스트리밍
-        answer_chunks = []
-        knowledge_context = format_knowledge_context(similar_faqs)
+    async def _replay_cached_answer(
+        self, session_id: str, message: str, cached_answer: CachedAnswer
+    ) -> AsyncGenerator[ChatResponse, None]:
+        yield ChatResponse(message=cached_answer.answer, metadata={"cached": True})
 
-        async for chunk in self.create_chat_completion(
-            query=message,
-            chat_history=chat_history,
-            knowledge_context=knowledge_context,
-        ):
-            answer_chunks.append(chunk)
-            yield ChatResponse(message=chunk)
+        await self.save_turn(session_id, message, cached_answer.answer)
 
-        # 완성된 답변 저장
-        complete_answer = "".join(answer_chunks)
-        assistant_message = Message(content=complete_answer, role="assistant")
-        await self.memory_repository.save_message(session_id, assistant_message)
+        yield ChatResponse(message="[DONE]", follow_ups=cached_answer.follow_ups)
 
-        # 후속 질문 생성
-        yield await self.get_follow_up_message(
-            query=message,
-            answer=complete_answer,
-            chat_history=chat_history,
-            similar_faqs=similar_faqs,
+    async def save_turn(self, session_id: str, query: str, answer: str) -> None:
+        # 요약 대상 판단을 위해 저장 직후의 전체 대화를 함께 받아옴
+        chat_history = await self.memory_repository.append_turn(
+            session_id,
+            [
+                Message(content=query, role="user"),
+                Message(content=answer, role="assistant"),
+            ],
+            limit=settings.REDIS_MAX_MESSAGES,
         )
+        if self.summary_service is not None:
+            self.summary_service.schedule_compaction(session_id, chat_history)
 
     @log_execution_time
     async def get_follow_up_message(
@@ -115,11 +342,14 @@ class SmartStoreChatService(ChatService):
         chat_history: list[Message],
         similar_faqs: list[dict],
     ) -> ChatResponse:
+        prompt_context = self.build_prompt_context(
+            "follow_up", query, similar_faqs, chat_history, self.follow_up_budget
+        )
         follow_up_messages = prompts.PT_FOLLOW_UP_QUESTIONS.format(
             query=query,
             answer=answer,
-            context=format_knowledge_context(similar_faqs),
-            chat_history=format_chat_history(chat_history),
+            context=prompt_context.knowledge_context,
+            chat_history=prompt_context.chat_history,
         )
 
         follow_up_response = await self.llm_service.generate_completion(
@@ -1,14 +1,16 @@
-from openai import AsyncStream
+from typing import AsyncIterator
+
 from openai.types.chat import ChatCompletion, ChatCompletionChunk
 
 from core.config import settings
-from infrastructure.openai.client import get_openai_client
+from infrastructure.openai.client import get_openai_client, get_upstream_limiter
 from interfaces.services.llm import LLMService
 
 
 class OpenAIService(LLMService):
     def __init__(self):
         self.client = get_openai_client()
+        self.limiter = get_upstream_limiter("chat")
         self.chat_model = settings.OPENAI_CHAT_MODEL
         self.embedding_model = settings.OPENAI_EMBEDDING_MODEL
 
@@ -17,15 +19,22 @@ class OpenAIService(LLMService):
         messages: list[dict[str, str]],
         temperature: float = 0.7,
         stream: bool = False,
-    ) -> ChatCompletion | AsyncStream[ChatCompletionChunk] | str:
-        response = await self.client.chat.completions.create(
-            model=self.chat_model,
-            messages=messages,
-            temperature=temperature,
-            stream=stream,
-        )
+        response_format: dict | None = None,
+    ) -> ChatCompletion | AsyncIterator[ChatCompletionChunk] | str:
+        request = {
+            "model": self.chat_model,
+            "messages": messages,
+            "temperature": temperature,
+            "stream": stream,
+        }
+        if response_format is not None:
+            request["response_format"] = response_format
 
         if stream:
-            return response
+            return self.limiter.stream(self.client.chat.completions.create, **request)
+
+        response = await self.limiter.call(
+            self.client.chat.completions.create, **request
+        )
 
         return response.choices[0].message.content.strip()
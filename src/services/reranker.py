@@ -0,0 +1,124 @@
+import asyncio
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from time import perf_counter
+
+from core.config import settings
+from core.logging import setup_logger
+from interfaces.services.reranker import RerankerService
+from utils.cache import TTLCache
+
+logger = setup_logger(__name__)
+
+
+@dataclass
+class RerankStats:
+    calls: int = 0
+    candidates: int = 0
+    scored: int = 0
+    total_ms: float = 0.0
+    total_model_ms: float = 0.0
+
+    @property
+    def avg_ms(self) -> float:
+        return self.total_ms / self.calls if self.calls else 0.0
+
+    @property
+    def avg_model_ms(self) -> float:
+        return self.total_model_ms / self.calls if self.calls else 0.0
+
+
+class CrossEncoderRerankerService(RerankerService):
+    """
+    (질의, FAQ) 쌍을 로컬 cross-encoder로 한 번에 점수화하여 검색 후보를 재정렬
+    sentence-transformers가 설치되어 있어야 하며, 점수는 (질의, 문서) 단위로 캐시됨
+    """
+
+    def __init__(
+        self,
+        model_name: str = None,
+        max_length: int = None,
+        cache_max_size: int = None,
+        cache_ttl: int = None,
+    ):
+        self.model_name = model_name or settings.RERANK_MODEL
+        self.max_length = max_length or settings.RERANK_MAX_LENGTH
+        self.score_cache: TTLCache[tuple[str, str], float] = TTLCache(
+            max_size=cache_max_size or settings.RERANK_CACHE_MAX_SIZE,
+            ttl=cache_ttl or settings.RERANK_CACHE_TTL,
+        )
+        self.stats = RerankStats()
+        self._model = None
+        # 모델 추론은 CPU 연산이므로 이벤트 루프 밖의 단일 스레드에서 순서대로 실행
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="rerank")
+
+    def _get_model(self):
+        if self._model is None:
+            from sentence_transformers import CrossEncoder
+
+            self._model = CrossEncoder(
+                self.model_name, max_length=self.max_length, device="cpu"
+            )
+        return self._model
+
+    def _predict(self, pairs: list[tuple[str, str]]) -> list[float]:
+        return [float(score) for score in self._get_model().predict(pairs)]
+
+    @staticmethod
+    def _get_document(candidate: dict) -> str:
+        passages = candidate.get("passages")
+        body = "\n".join(passages) if passages else candidate["answer"]
+        return f"{candidate['question']}\n{body}"
+
+    async def rerank(
+        self, query: str, candidates: list[dict], limit: int
+    ) -> list[dict]:
+        start_time = perf_counter()
+
+        documents = [self._get_document(candidate) for candidate in candidates]
+        keys = [
+            (query, hashlib.sha1(document.encode("utf-8")).hexdigest())
+            for document in documents
+        ]
+        scores = [self.score_cache.get(key) for key in keys]
+
+        # 캐시에 없는 후보만 모아 한 번의 배치 추론으로 점수화
+        missing = [i for i, score in enumerate(scores) if score is None]
+        model_ms = 0.0
+        if missing:
+            model_start_time = perf_counter()
+            predicted = await asyncio.get_running_loop().run_in_executor(
+                self._executor,
+                self._predict,
+                [(query, documents[i]) for i in missing],
+            )
+            model_ms = (perf_counter() - model_start_time) * 1000
+            for i, score in zip(missing, predicted):
+                scores[i] = score
+                self.score_cache.set(keys[i], score)
+
+        reranked = sorted(
+            (
+                {**candidate, "rerank_score": score}
+                for candidate, score in zip(candidates, scores)
+            ),
+            key=lambda candidate: candidate["rerank_score"],
+            reverse=True,
+        )
+
+        elapsed_ms = (perf_counter() - start_time) * 1000
+        self.stats.calls += 1
+        self.stats.candidates += len(candidates)
+        self.stats.scored += len(missing)
+        self.stats.total_ms += elapsed_ms
+        self.stats.total_model_ms += model_ms
+        logger.info(
+            f"Reranked {len(candidates)} candidates ({len(missing)} scored by model) "
+            f"in {elapsed_ms:.2f}ms (model {model_ms:.2f}ms, "
+            f"avg {self.stats.avg_ms:.2f}ms)"
+        )
+        return reranked[:limit]
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
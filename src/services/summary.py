@@ -0,0 +1,89 @@
+import asyncio
+
+from core.config import settings
+from core.logging import setup_logger
+from core.prompts import prompts
+from domain.chat import Message
+from interfaces.repositories.memory import ChatMemoryRepository
+from interfaces.services.llm import LLMService
+from interfaces.services.summary import ChatSummaryService
+from utils.format import format_chat_history
+from utils.tokens import count_tokens
+
+logger = setup_logger(__name__)
+
+
+class RollingChatSummaryService(ChatSummaryService):
+    """
+    저장된 대화가 토큰 임계값을 넘으면 최근 메시지만 남기고 나머지를 요약으로 압축
+    요약은 응답 경로를 막지 않도록 백그라운드 태스크에서 생성되며, 세션당 하나만 실행됨
+    """
+
+    def __init__(
+        self,
+        llm_service: LLMService,
+        memory_repository: ChatMemoryRepository,
+        trigger_tokens: int = None,
+        keep_messages: int = None,
+    ):
+        self.llm_service = llm_service
+        self.memory_repository = memory_repository
+        self.trigger_tokens = trigger_tokens or settings.CHAT_SUMMARY_TRIGGER_TOKENS
+        self.keep_messages = keep_messages or settings.CHAT_SUMMARY_KEEP_MESSAGES
+        self.max_messages = settings.REDIS_MAX_MESSAGES
+        self.model_name = settings.OPENAI_CHAT_MODEL
+        self._tasks: dict[str, asyncio.Task] = {}
+
+    def schedule_compaction(self, session_id: str, chat_history: list[Message]) -> None:
+        """
+        chat_history는 append_turn이 반환한 시간순 대화 (요약이 있으면 맨 앞 system 메시지)
+        """
+        if session_id in self._tasks:
+            return
+
+        summary = next(
+            (message.content for message in chat_history if message.role == "system"),
+            "",
+        )
+        messages = [message for message in chat_history if message.role != "system"]
+        if len(messages) <= self.keep_messages:
+            return
+
+        # 리스트가 trim되어 메시지가 유실되기 전에도 압축
+        history_tokens = count_tokens(format_chat_history(messages), self.model_name)
+        if history_tokens < self.trigger_tokens and len(messages) < self.max_messages:
+            return
+
+        task = asyncio.create_task(
+            self._compact(session_id, summary, messages[: -self.keep_messages])
+        )
+        self._tasks[session_id] = task
+        task.add_done_callback(lambda _: self._tasks.pop(session_id, None))
+
+    async def _compact(
+        self, session_id: str, summary: str, summarized_messages: list[Message]
+    ) -> None:
+        try:
+            new_summary = await self.llm_service.generate_completion(
+                messages=prompts.PT_SUMMARIZE_HISTORY.format(
+                    summary=summary or "없음",
+                    chat_history=format_chat_history(summarized_messages),
+                ),
+                temperature=0.2,
+            )
+            compacted = await self.memory_repository.compact_history(
+                session_id, new_summary, summarized_messages
+            )
+            if compacted:
+                logger.debug(
+                    f"Compacted {len(summarized_messages)} messages of session "
+                    f"{session_id} into summary"
+                )
+        except Exception as e:
+            logger.warning(f"Chat history compaction failed: {str(e)}")
+
+    async def close(self) -> None:
+        tasks = list(self._tasks.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
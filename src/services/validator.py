@@ -1,41 +1,168 @@
 import asyncio
+import json
+from collections import Counter
 
+from core.config import settings
 from core.decorators import log_execution_time
+from core.logging import setup_logger
 from core.prompts import prompts, PromptTemplate
 from domain.chat import Message
+from domain.prompt import ContextBudget, PromptContext
 from domain.validation import ValidationResult, ValidationStrategy
 from interfaces.services.llm import LLMService
 from interfaces.services.validator import QuestionValidatorService
-from utils.format import format_knowledge_context, format_chat_history
+from utils.context import build_prompt_context
+
+logger = setup_logger(__name__)
 
 
 class SmartStoreQuestionValidator(QuestionValidatorService):
-    def __init__(self, llm_service: LLMService):
+    def __init__(
+        self,
+        llm_service: LLMService,
+        fast_path_enabled: bool = None,
+        accept_score: float = None,
+        reject_score: float = None,
+        validation_mode: str = None,
+    ):
         self.llm_service = llm_service
+        self.validation_mode = validation_mode or settings.VALIDATION_MODE
+        self.fast_path_enabled = (
+            settings.VALIDATION_FAST_PATH_ENABLED
+            if fast_path_enabled is None
+            else fast_path_enabled
+        )
+        self.accept_score = (
+            settings.VALIDATION_FAST_ACCEPT_SCORE
+            if accept_score is None
+            else accept_score
+        )
+        self.reject_score = (
+            settings.VALIDATION_FAST_REJECT_SCORE
+            if reject_score is None
+            else reject_score
+        )
+        self.tier_counts: Counter[str] = Counter()
+        # 검증은 관련성 판단만 하므로 답변 생성보다 훨씬 작은 컨텍스트 사용
+        self.budget = ContextBudget(
+            context_tokens=settings.VALIDATION_CONTEXT_TOKENS,
+            history_tokens=settings.VALIDATION_HISTORY_TOKENS,
+            max_answer_tokens=settings.VALIDATION_CONTEXT_TOKENS,
+        )
 
     @log_execution_time
     async def validate_question(
         self, query: str, chat_history: list[Message], similar_faqs: list[dict]
+    ) -> ValidationResult:
+        if self.fast_path_enabled:
+            result = self._validate_by_retrieval_score(chat_history, similar_faqs)
+            if result is not None:
+                return result
+
+        self.tier_counts["llm"] += 1
+        prompt_context = build_prompt_context(
+            query, similar_faqs, chat_history, self.budget, settings.OPENAI_CHAT_MODEL
+        )
+        logger.debug(f"validation prompt tokens: {prompt_context.token_usage}")
+
+        if self.validation_mode == "structured":
+            result = await self._validate_by_structured_output(query, prompt_context)
+            if result is not None:
+                return result
+            logger.warning("Structured validation failed, falling back to ensemble")
+
+        return await self._validate_by_ensemble(query, prompt_context)
+
+    def _validate_by_retrieval_score(
+        self, chat_history: list[Message], similar_faqs: list[dict]
+    ) -> ValidationResult | None:
+        """
+        검색 점수가 명확한 경우 LLM 호출 없이 판단, 애매한 구간이면 None 반환
+        """
+        # 검색 결과가 없으면(인덱스 비어 있음/동기화 중 등) 점수로 판단할 수 없음
+        if not similar_faqs:
+            return None
+
+        # 재정렬 후에는 첫 번째 후보의 검색 점수가 최고점이 아닐 수 있음
+        top_score = max(faq["score"] for faq in similar_faqs)
+
+        if top_score >= self.accept_score:
+            tier = "accept"
+            is_related = True
+        # 이전 대화를 참조하는 질문은 검색 점수가 낮을 수 있으므로 LLM 판단에 맡김
+        elif top_score < self.reject_score and not chat_history:
+            tier = "reject"
+            is_related = False
+        else:
+            return None
+
+        self.tier_counts[tier] += 1
+        logger.debug(
+            f"Fast-path validation {tier} (score={top_score:.3f}, "
+            f"tiers={dict(self.tier_counts)})"
+        )
+        return ValidationResult(
+            is_related=is_related,
+            confidence=top_score,
+            strategy=ValidationStrategy.RETRIEVAL,
+        )
+
+    async def _validate_by_ensemble(
+        self, query: str, prompt_context: PromptContext
     ) -> ValidationResult:
         validation_tasks = [
             self._execute_strategy(
                 prompts.PT_DIRECT_VALIDATION,
                 query,
-                chat_history,
-                similar_faqs,
+                prompt_context,
                 ValidationStrategy.DIRECT,
             ),
             self._execute_strategy(
                 prompts.PT_INDIRECT_VALIDATION,
                 query,
-                chat_history,
-                similar_faqs,
+                prompt_context,
                 ValidationStrategy.INDIRECT,
             ),
         ]
 
         results = await asyncio.gather(*validation_tasks)
+        return self._select_best_result(results)
+
+    async def _validate_by_structured_output(
+        self, query: str, prompt_context: PromptContext
+    ) -> ValidationResult | None:
+        """
+        직접/간접 검증 결과를 한 번의 JSON 응답으로 받아 처리, 파싱 실패 시 None 반환
+        """
+        messages = prompts.PT_STRUCTURED_VALIDATION.format(
+            query=query,
+            chat_history=prompt_context.chat_history,
+            context=prompt_context.knowledge_context,
+        )
+
+        response = await self.llm_service.generate_completion(
+            messages=messages, response_format={"type": "json_object"}
+        )
+
+        try:
+            data = json.loads(response)
+            results = [
+                ValidationResult(
+                    is_related=bool(data[strategy.value]["is_related"]),
+                    confidence=float(data[strategy.value]["confidence"]),
+                    strategy=strategy,
+                )
+                for strategy in (ValidationStrategy.DIRECT, ValidationStrategy.INDIRECT)
+            ]
+        except (ValueError, KeyError, TypeError) as e:
+            logger.debug(
+                f"Unexpected structured validation response ({str(e)}): {response!r}"
+            )
+            return None
+
+        return self._select_best_result(results)
 
+    def _select_best_result(self, results: list[ValidationResult]) -> ValidationResult:
         # 가중치를 적용한 최종 점수 계산
         weighted_results = []
         for result in results:
@@ -59,14 +186,13 @@ class SmartStoreQuestionValidator(QuestionValidatorService):
         self,
         prompt_template: PromptTemplate,
         query: str,
-        chat_history: list[Message],
-        similar_faqs: list[dict],
+        prompt_context: PromptContext,
         strategy: ValidationStrategy,
     ) -> ValidationResult:
         messages = prompt_template.format(
             query=query,
-            chat_history=format_chat_history(chat_history),
-            context=format_knowledge_context(similar_faqs),
+            chat_history=prompt_context.chat_history,
+            context=prompt_context.knowledge_context,
         )
 
         response = await self.llm_service.generate_completion(messages=messages)
@@ -0,0 +1,65 @@
+from collections import OrderedDict
+from time import monotonic
+from typing import Generic, Hashable, TypeVar
+
+from domain.cache import CacheStats
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class TTLCache(Generic[K, V]):
+    """
+    크기 및 TTL 제한이 있는 프로세스 내 LRU 캐시
+    """
+
+    def __init__(self, max_size: int, ttl: float | None = None):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.stats = CacheStats()
+        self._entries: OrderedDict[K, tuple[float | None, V]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: K) -> bool:
+        entry = self._entries.get(key)
+        return entry is not None and not self._is_expired(entry[0])
+
+    def _is_expired(self, expires_at: float | None) -> bool:
+        return expires_at is not None and expires_at <= monotonic()
+
+    def get(self, key: K) -> V | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            self.stats.misses += 1
+            return None
+
+        expires_at, value = entry
+        if self._is_expired(expires_at):
+            del self._entries[key]
+            self.stats.expirations += 1
+            self.stats.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.stats.hits += 1
+        return value
+
+    def set(self, key: K, value: V, ttl: float | None = None) -> None:
+        ttl = self.ttl if ttl is None else ttl
+        expires_at = monotonic() + ttl if ttl is not None else None
+
+        self._entries[key] = (expires_at, value)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.stats.evictions += 1
+
+    def pop(self, key: K) -> V | None:
+        entry = self._entries.pop(key, None)
+        return entry[1] if entry is not None else None
+
+    def clear(self) -> None:
+        self._entries.clear()
@@ -0,0 +1,108 @@
+import json
+from abc import ABC, abstractmethod
+from functools import lru_cache
+
+from domain.chat import Message
+
+# JSON 항목은 항상 "{"로 시작하므로 첫 바이트로 포맷을 구분
+_MSGPACK_PREFIX = b"\x01"
+_MSGPACK_ZSTD_PREFIX = b"\x02"
+
+
+class MessageCodec(ABC):
+    """
+    채팅 메시지 <-> Redis 저장 바이트 변환
+    decode는 코덱 종류와 관계없이 기존 JSON 항목을 포함한 모든 포맷을 읽음
+    """
+
+    name: str
+
+    @abstractmethod
+    def encode(self, message: Message) -> bytes:
+        pass
+
+    def decode(self, data: bytes | str) -> Message:
+        return decode_message(data)
+
+
+class JsonMessageCodec(MessageCodec):
+    name = "json"
+
+    def encode(self, message: Message) -> bytes:
+        return json.dumps(
+            {"content": message.content, "role": message.role}, ensure_ascii=False
+        ).encode("utf-8")
+
+
+class MsgpackMessageCodec(MessageCodec):
+    """
+    (role, content)를 msgpack으로 직렬화하고, zstandard가 설치되어 있으면
+    compress_min_bytes 이상인 메시지(주로 긴 답변)만 압축
+    """
+
+    name = "msgpack"
+
+    def __init__(self, compress_min_bytes: int = 1024, compression_level: int = 3):
+        self._msgpack = _import_msgpack()
+        if self._msgpack is None:
+            raise ImportError("msgpack is required for MsgpackMessageCodec")
+
+        zstandard = _import_zstandard() if compress_min_bytes > 0 else None
+        self.compress_min_bytes = compress_min_bytes
+        self._compressor = (
+            zstandard.ZstdCompressor(level=compression_level)
+            if zstandard is not None
+            else None
+        )
+
+    @property
+    def compression_enabled(self) -> bool:
+        return self._compressor is not None
+
+    def encode(self, message: Message) -> bytes:
+        packed = self._msgpack.packb((message.role, message.content))
+        if self._compressor is not None and len(packed) >= self.compress_min_bytes:
+            compressed = self._compressor.compress(packed)
+            if len(compressed) < len(packed):
+                return _MSGPACK_ZSTD_PREFIX + compressed
+        return _MSGPACK_PREFIX + packed
+
+
+def decode_message(data: bytes | str) -> Message:
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+
+    prefix = data[:1]
+    if prefix == _MSGPACK_PREFIX:
+        role, content = _import_msgpack().unpackb(data[1:])
+    elif prefix == _MSGPACK_ZSTD_PREFIX:
+        role, content = _import_msgpack().unpackb(
+            _get_decompressor().decompress(data[1:])
+        )
+    else:
+        payload = json.loads(data)
+        role, content = payload["role"], payload["content"]
+    return Message(content=content, role=role)
+
+
+@lru_cache()
+def _import_msgpack():
+    try:
+        import msgpack
+    except ImportError:
+        return None
+    return msgpack
+
+
+@lru_cache()
+def _import_zstandard():
+    try:
+        import zstandard
+    except ImportError:
+        return None
+    return zstandard
+
+
+@lru_cache()
+def _get_decompressor():
+    return _import_zstandard().ZstdDecompressor()
@@ -0,0 +1,165 @@
+import re
+
+from domain.chat import Message
+from domain.prompt import ContextBudget, PromptContext
+from utils.format import format_chat_history, format_knowledge_context
+from utils.text import tokenize
+from utils.tokens import count_tokens, truncate_tokens
+
+# 이보다 적은 토큰이 남으면 잘린 답변/메시지를 넣지 않음
+_MIN_SECTION_TOKENS = 32
+_PARAGRAPH_PATTERN = re.compile(r"\n\s*\n")
+
+
+def build_prompt_context(
+    query: str,
+    faqs: list[dict],
+    chat_history: list[Message],
+    budget: ContextBudget,
+    model_name: str,
+) -> PromptContext:
+    knowledge_context, context_tokens = build_knowledge_context(
+        query, faqs, budget.context_tokens, budget.max_answer_tokens, model_name
+    )
+    history, history_tokens = build_chat_history(
+        chat_history, budget.history_tokens, model_name
+    )
+    return PromptContext(
+        knowledge_context=knowledge_context,
+        chat_history=history,
+        token_usage={"context": context_tokens, "chat_history": history_tokens},
+    )
+
+
+def build_knowledge_context(
+    query: str,
+    faqs: list[dict],
+    max_tokens: int,
+    max_answer_tokens: int,
+    model_name: str,
+) -> tuple[str, int]:
+    """
+    점수 순으로 FAQ를 토큰 예산만큼 채우고, 긴 답변은 질의와 관련된 문단만 남김
+    (컨텍스트 문자열, 사용 토큰 수) 반환
+    """
+    query_terms = set(tokenize(query))
+
+    selected_faqs = []
+    used_tokens = 0
+    for faq in faqs:
+        question_tokens = count_tokens(f"Q: {faq['question']}\nA: ", model_name) + 2
+        answer_budget = min(
+            max_answer_tokens, max_tokens - used_tokens - question_tokens
+        )
+        if answer_budget < _MIN_SECTION_TOKENS:
+            break
+
+        # 검색된 passage가 있으면 답변 전체 대신 해당 passage만 사용
+        answer = (
+            join_passages(faq["passages"]) if faq.get("passages") else faq["answer"]
+        )
+        answer = select_passages(answer, query_terms, answer_budget, model_name)
+        selected_faqs.append({"question": faq["question"], "answer": answer})
+        used_tokens += question_tokens + count_tokens(answer, model_name)
+
+    return format_knowledge_context(selected_faqs), used_tokens
+
+
+def join_passages(passages: list[str]) -> str:
+    """
+    인접 passage가 겹치는 줄은 한 번만 포함하도록 이어 붙임
+    """
+    lines = []
+    for passage in passages:
+        passage_lines = passage.splitlines()
+        overlap = next(
+            (
+                size
+                for size in range(min(len(lines), len(passage_lines)), 0, -1)
+                if lines[-size:] == passage_lines[:size]
+            ),
+            0,
+        )
+        lines.extend(passage_lines[overlap:])
+    return "\n".join(lines)
+
+
+def select_passages(
+    text: str, query_terms: set[str], max_tokens: int, model_name: str
+) -> str:
+    """
+    예산을 넘는 답변을 문단 단위로 나누어 질의어와 많이 겹치는 문단부터 선택 (원래 순서 유지)
+    """
+    if count_tokens(text, model_name) <= max_tokens:
+        return text
+
+    passages = []
+    for paragraph in _PARAGRAPH_PATTERN.split(text):
+        if count_tokens(paragraph, model_name) > max_tokens:
+            passages.extend(paragraph.splitlines())
+        else:
+            passages.append(paragraph)
+    passages = [passage.strip() for passage in passages if passage.strip()]
+    if not passages:
+        return truncate_tokens(text, max_tokens, model_name)
+
+    overlaps = [len(query_terms.intersection(tokenize(p))) for p in passages]
+    ranked = sorted(range(len(passages)), key=lambda i: (-overlaps[i], i))
+
+    selected = []
+    used_tokens = 0
+    for i in ranked:
+        tokens = count_tokens(passages[i], model_name) + 1
+        if used_tokens + tokens <= max_tokens:
+            selected.append(i)
+            used_tokens += tokens
+
+    if not selected:
+        return truncate_tokens(passages[ranked[0]], max_tokens, model_name)
+    return "\n\n".join(passages[i] for i in sorted(selected))
+
+
+def build_chat_history(
+    messages: list[Message], max_tokens: int, model_name: str
+) -> tuple[str, int]:
+    """
+    최신 메시지부터 토큰 예산만큼 채우고 시간순으로 출력 (messages는 시간순)
+    이전 대화 요약(system 메시지)은 예산을 먼저 차지하며 항상 맨 앞에 위치
+    (대화 내역 문자열, 사용 토큰 수) 반환
+    """
+    summaries = [message for message in messages if message.role == "system"]
+    messages = [message for message in messages if message.role != "system"]
+
+    summary_messages = []
+    used_tokens = 0
+    for summary in summaries:
+        tokens = count_tokens(format_chat_history([summary]), model_name) + 1
+        if used_tokens + tokens > max_tokens:
+            break
+        summary_messages.append(summary)
+        used_tokens += tokens
+
+    selected_messages = []
+    for message in reversed(messages):
+        tokens = count_tokens(format_chat_history([message]), model_name) + 1
+        if used_tokens + tokens > max_tokens:
+            remaining = max_tokens - used_tokens
+            if remaining >= _MIN_SECTION_TOKENS:
+                prefix_tokens = count_tokens(
+                    format_chat_history([Message(content="", role=message.role)]),
+                    model_name,
+                )
+                content = truncate_tokens(
+                    message.content, remaining - prefix_tokens, model_name
+                )
+                selected_messages.append(Message(content=content, role=message.role))
+                used_tokens = max_tokens
+            break
+
+        selected_messages.append(message)
+        used_tokens += tokens
+
+    return (
+        format_chat_history(summary_messages + selected_messages[::-1]),
+        used_tokens,
+    )
@@ -1,10 +1,18 @@
 from domain.chat import Message
 
+# 대화 내역의 system 메시지는 이전 대화 요약
+_ROLE_LABELS = {"system": "Summary"}
+
 
 def format_chat_history(messages: list[Message]) -> str:
     if not messages:
         return ""
-    return "\n".join([f"{msg.role.capitalize()}: {msg.content}" for msg in messages])
+    return "\n".join(
+        [
+            f"{_ROLE_LABELS.get(msg.role, msg.role.capitalize())}: {msg.content}"
+            for msg in messages
+        ]
+    )
 
 
 def format_knowledge_context(faqs: list[dict]) -> str:
@@ -1,29 +1,146 @@
+import asyncio
 import json
+from time import monotonic
 from typing import Any, AsyncGenerator
 
 from domain.chat import ChatResponse
 
+_MESSAGE_PREFIX = b'data: {"type": "message", "content": '
+_FOLLOW_UP_PREFIX = b'data: {"type": "follow_up", "content": '
+_FRAME_SUFFIX = b"}\n\n"
+_DONE_FRAME = b'data: {"type": "done", "content": "[DONE]"}\n\n'
+_HEARTBEAT_FRAME = b": heartbeat\n\n"
 
-class StreamingJsonResponse:
-    @staticmethod
-    def format_sse(data: dict[str, Any]) -> str:
-        return f"data: {json.dumps(data, ensure_ascii=False)}\n\n"
-
-    @staticmethod
-    async def create_stream(
-        response_generator: AsyncGenerator[ChatResponse, None],
-    ) -> AsyncGenerator[str, None]:
-        async for response in response_generator:
-            if response.message == "[DONE]":
-                if response.follow_ups:
-                    for follow_up in response.follow_ups:
-                        yield StreamingJsonResponse.format_sse(
-                            {"type": "follow_up", "content": follow_up}
-                        )
-                yield StreamingJsonResponse.format_sse(
-                    {"type": "done", "content": "[DONE]"}
+
+def encode_sse_event(data: dict[str, Any]) -> bytes:
+    return b"data: " + json.dumps(data, ensure_ascii=False).encode("utf-8") + b"\n\n"
+
+
+def encode_sse_frame(prefix: bytes, content: str) -> bytes:
+    return (
+        prefix + json.dumps(content, ensure_ascii=False).encode("utf-8") + _FRAME_SUFFIX
+    )
+
+
+class _MessageBuffer:
+    def __init__(self):
+        self.chunks: list[str] = []
+        self.size = 0
+        self.flush_at: float | None = None
+
+    def append(self, chunk: str, coalesce_seconds: float) -> None:
+        self.chunks.append(chunk)
+        self.size += len(chunk.encode("utf-8"))
+        if self.flush_at is None:
+            self.flush_at = monotonic() + coalesce_seconds
+
+    def take_frame(self) -> bytes:
+        frame = encode_sse_frame(_MESSAGE_PREFIX, "".join(self.chunks))
+        self.chunks.clear()
+        self.size = 0
+        self.flush_at = None
+        return frame
+
+
+class SSEEncoder:
+    """
+    ChatResponse 스트림을 미리 인코딩된 SSE 바이트 프레임으로 변환
+    답변 토큰은 coalesce_ms 또는 coalesce_bytes 단위로 모아 하나의 프레임으로 전송하고
+    (첫 토큰은 바로 전송), heartbeat_interval 동안 보낸 것이 없으면 SSE 주석을 전송
+    """
+
+    def __init__(
+        self,
+        coalesce_ms: float = 20,
+        coalesce_bytes: int = 64,
+        heartbeat_interval: float | None = 15,
+    ):
+        self.coalesce_seconds = coalesce_ms / 1000
+        self.coalesce_bytes = coalesce_bytes
+        self.heartbeat_interval = heartbeat_interval
+
+    async def encode(
+        self, response_generator: AsyncGenerator[ChatResponse, None]
+    ) -> AsyncGenerator[bytes, None]:
+        buffer = _MessageBuffer()
+        first_message = True
+        last_sent_at = monotonic()
+
+        next_response = asyncio.ensure_future(anext(response_generator))
+        try:
+            while True:
+                done, _ = await asyncio.wait(
+                    {next_response},
+                    timeout=self._get_timeout(buffer.flush_at, last_sent_at),
                 )
-            else:
-                yield StreamingJsonResponse.format_sse(
-                    {"type": "message", "content": response.message}
+
+                if not done:
+                    # 대기 시간 만료: 모아둔 토큰을 보내거나 heartbeat 전송
+                    yield buffer.take_frame() if buffer.chunks else _HEARTBEAT_FRAME
+                    last_sent_at = monotonic()
+                    continue
+
+                try:
+                    response = next_response.result()
+                except StopAsyncIteration:
+                    break
+                next_response = asyncio.ensure_future(anext(response_generator))
+
+                if response.metadata:
+                    # 메타데이터(예: 캐시 응답 여부)가 있는 메시지는 모으지 않고 그대로 전송
+                    frames = [buffer.take_frame()] if buffer.chunks else []
+                    frames.append(
+                        encode_sse_event(
+                            {
+                                "type": "message",
+                                "content": response.message,
+                                "metadata": response.metadata,
+                            }
+                        )
+                    )
+                    yield b"".join(frames)
+                    first_message = False
+                    last_sent_at = monotonic()
+                    continue
+
+                if response.message != "[DONE]":
+                    buffer.append(response.message, self.coalesce_seconds)
+                    if not (
+                        first_message
+                        or buffer.size >= self.coalesce_bytes
+                        or monotonic() >= buffer.flush_at
+                    ):
+                        continue
+
+                    yield buffer.take_frame()
+                    first_message = False
+                    last_sent_at = monotonic()
+                    continue
+
+                # 남은 토큰, 후속 질문, 완료 이벤트를 한 번에 전송
+                frames = [buffer.take_frame()] if buffer.chunks else []
+                frames.extend(
+                    encode_sse_frame(_FOLLOW_UP_PREFIX, follow_up)
+                    for follow_up in response.follow_ups or []
                 )
+                frames.append(_DONE_FRAME)
+                yield b"".join(frames)
+                last_sent_at = monotonic()
+
+            if buffer.chunks:
+                yield buffer.take_frame()
+        finally:
+            if not next_response.done():
+                next_response.cancel()
+                await asyncio.gather(next_response, return_exceptions=True)
+            await response_generator.aclose()
+
+    def _get_timeout(self, flush_at: float | None, last_sent_at: float) -> float | None:
+        deadlines = []
+        if flush_at is not None:
+            deadlines.append(flush_at)
+        if self.heartbeat_interval:
+            deadlines.append(last_sent_at + self.heartbeat_interval)
+        if not deadlines:
+            return None
+        return max(min(deadlines) - monotonic(), 0)
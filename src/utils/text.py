@@ -0,0 +1,79 @@
+import re
+import unicodedata
+from typing import Callable
+
+_WORD_PATTERN = re.compile(r"[0-9a-z가-힣]+")
+_SCRIPT_PATTERN = re.compile(r"[0-9a-z]+|[가-힣]+")
+_HANGUL_PATTERN = re.compile(r"[가-힣]")
+
+
+def tokenize(text: str) -> list[str]:
+    """
+    한국어 검색용 토큰화: 어절 단위 토큰과 한글 어절의 문자 bigram을 함께 사용
+    조사/어미가 붙어도 bigram이 겹치므로 형태소 분석기 없이 부분 일치가 가능
+    예: "N배송은" -> ["n배송은", "n", "배송은", "배송", "송은"]
+    """
+    text = unicodedata.normalize("NFKC", text).lower()
+
+    tokens = []
+    for word in _WORD_PATTERN.findall(text):
+        parts = _SCRIPT_PATTERN.findall(word)
+        if len(parts) > 1:
+            tokens.append(word)
+
+        for part in parts:
+            tokens.append(part)
+            if _HANGUL_PATTERN.match(part) and len(part) > 2:
+                tokens.extend(part[i : i + 2] for i in range(len(part) - 1))
+    return tokens
+
+
+_PARAGRAPH_PATTERN = re.compile(r"\n\s*\n")
+_SENTENCE_PATTERN = re.compile(r"(?<=[.!?])\s+")
+
+
+def split_passages(
+    text: str,
+    max_tokens: int,
+    overlap_tokens: int,
+    count_tokens: Callable[[str], int],
+) -> list[str]:
+    """
+    문단 > 줄 > 문장 순으로 구조를 따라 나눈 뒤 max_tokens 이하의 passage로 묶음
+    이전 passage의 마지막 단위(overlap_tokens 이하)를 다음 passage 앞에 겹쳐 넣어 문맥 유지
+    """
+    units = []
+    for paragraph in _PARAGRAPH_PATTERN.split(text):
+        paragraph = paragraph.strip()
+        if not paragraph:
+            continue
+        if count_tokens(paragraph) <= max_tokens:
+            units.append(paragraph)
+            continue
+        for line in paragraph.splitlines():
+            line = line.strip()
+            if not line:
+                continue
+            if count_tokens(line) <= max_tokens:
+                units.append(line)
+            else:
+                units.extend(s for s in _SENTENCE_PATTERN.split(line) if s)
+
+    passages = []
+    current, current_tokens = [], 0
+    for unit in units:
+        tokens = count_tokens(unit)
+        if current and current_tokens + tokens > max_tokens:
+            passages.append("\n".join(current))
+            last = current[-1]
+            last_tokens = count_tokens(last)
+            if last_tokens <= overlap_tokens and last_tokens + tokens <= max_tokens:
+                current, current_tokens = [last], last_tokens
+            else:
+                current, current_tokens = [], 0
+        current.append(unit)
+        current_tokens += tokens
+
+    if current:
+        passages.append("\n".join(current))
+    return passages or [text]
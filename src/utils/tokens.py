@@ -0,0 +1,40 @@
+from functools import lru_cache
+
+from loguru import logger
+
+
+@lru_cache()
+def get_encoding(model_name: str):
+    try:
+        import tiktoken
+    except ImportError:
+        # lru_cache로 모델별 한 번만 경고
+        logger.warning(
+            "tiktoken is not installed, token budgets fall back to character counts"
+        )
+        return None
+
+    try:
+        return tiktoken.encoding_for_model(model_name)
+    except KeyError:
+        return tiktoken.get_encoding("cl100k_base")
+
+
+@lru_cache(maxsize=4096)
+def count_tokens(text: str, model_name: str) -> int:
+    encoding = get_encoding(model_name)
+    if encoding is None:
+        # tiktoken 미설치 시 문자 수로 보수적으로 추정 (한글은 대략 글자당 1토큰 이상)
+        return len(text)
+    return len(encoding.encode(text, disallowed_special=()))
+
+
+def truncate_tokens(text: str, max_tokens: int, model_name: str) -> str:
+    encoding = get_encoding(model_name)
+    if encoding is None:
+        return text[:max_tokens]
+
+    tokens = encoding.encode(text, disallowed_special=())
+    if len(tokens) <= max_tokens:
+        return text
+    return encoding.decode(tokens[:max_tokens])